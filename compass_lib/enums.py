@@ -379,16 +379,21 @@ class Datum(StrEnum):
             return None
 
         # Normalize: lowercase, strip whitespace, collapse multiple spaces
-        normalized = " ".join(value.strip().lower().split())
+        normalized = " ".join(value.lower().split())
 
         # Match against enum values (case-insensitive)
-        for datum in cls:
-            if datum.value.lower() == normalized:
-                return datum
-
-        raise ValueError(f"Unknown datum: {value!r}")
+        try:
+            return _DATUM_BY_LOWER_VALUE[normalized]
+        except KeyError:
+            raise ValueError(f"Unknown datum: {value!r}") from None
 
     @classmethod
     def from_string(cls, value: str | None) -> "Datum | None":
         """Alias for normalize() for backwards compatibility."""
         return cls.normalize(value)
+
+
+# Lower-cased datum value -> Datum, so `Datum.normalize` is a single lookup.
+_DATUM_BY_LOWER_VALUE: dict[str, Datum] = {
+    datum.value.lower(): datum for datum in Datum
+}
@@ -39,14 +39,10 @@ class BeginSurveyCommand(CompassPlotCommand):
 
     def __str__(self) -> str:
         """Format as PLT file syntax."""
-        result = f"N{self.survey_name[:12]}"
-        if self.date:
-            result += f"\tD {self.date.month} {self.date.day} {self.date.year}"
-        else:
-            result += "\tD 1 1 1"
-        if self.comment:
-            result += f"\tC{self.comment[:80]}"
-        return result
+        d = self.date
+        date_str = f"D {d.month} {d.day} {d.year}" if d else "D 1 1 1"
+        comment = f"\tC{self.comment[:80]}" if self.comment else ""
+        return f"N{self.survey_name[:12]}\t{date_str}{comment}"
 
 
 class BeginSectionCommand(CompassPlotCommand):
@@ -82,10 +78,12 @@ class BeginFeatureCommand(CompassPlotCommand):
 
     def __str__(self) -> str:
         """Format as PLT file syntax."""
-        result = f"F{self.feature_name[:12]}"
-        if self.min_value is not None and self.max_value is not None:
-            result += f"\tR\t{float(self.min_value)}\t{float(self.max_value)}"
-        return result
+        if self.min_value is None or self.max_value is None:
+            return f"F{self.feature_name[:12]}"
+        return (
+            f"F{self.feature_name[:12]}"
+            f"\tR\t{float(self.min_value)}\t{float(self.max_value)}"
+        )
 
 
 class DrawSurveyCommand(CompassPlotCommand):
@@ -116,17 +114,16 @@ class DrawSurveyCommand(CompassPlotCommand):
     def __str__(self) -> str:
         """Format as PLT file syntax."""
         cmd = "M" if self.operation == DrawOperation.MOVE_TO else "D"
-        result = f"{cmd}\t{self.location.northing}\t{self.location.easting}"
-        result += f"\t{self.location.vertical}"
-        if self.station_name:
-            result += f"\tS{self.station_name[:12]}"
-        result += "\tP"
-        result += f"\t{self.left if self.left is not None else -9.0}"
-        result += f"\t{self.up if self.up is not None else -9.0}"
-        result += f"\t{self.down if self.down is not None else -9.0}"
-        result += f"\t{self.right if self.right is not None else -9.0}"
-        result += f"\tI\t{self.distance_from_entrance}"
-        return result
+        loc = self.location
+        station = f"\tS{self.station_name[:12]}" if self.station_name else ""
+        return (
+            f"{cmd}\t{loc.northing}\t{loc.easting}\t{loc.vertical}{station}\tP"
+            f"\t{self.left if self.left is not None else -9.0}"
+            f"\t{self.up if self.up is not None else -9.0}"
+            f"\t{self.down if self.down is not None else -9.0}"
+            f"\t{self.right if self.right is not None else -9.0}"
+            f"\tI\t{self.distance_from_entrance}"
+        )
 
 
 class FeatureCommand(CompassPlotCommand):
@@ -154,18 +151,17 @@ class FeatureCommand(CompassPlotCommand):
 
     def __str__(self) -> str:
         """Format as PLT file syntax."""
-        result = f"L\t{self.location.northing}\t{self.location.easting}"
-        result += f"\t{self.location.vertical}"
-        if self.station_name:
-            result += f"\tS{self.station_name[:12]}"
-        result += "\tP"
-        result += f"\t{self.left if self.left is not None else -9.0}"
-        result += f"\t{self.right if self.right is not None else -9.0}"
-        result += f"\t{self.up if self.up is not None else -9.0}"
-        result += f"\t{self.down if self.down is not None else -9.0}"
-        if self.value is not None:
-            result += f"\tV\t{self.value}"
-        return result
+        loc = self.location
+        station = f"\tS{self.station_name[:12]}" if self.station_name else ""
+        value = f"\tV\t{self.value}" if self.value is not None else ""
+        return (
+            f"L\t{loc.northing}\t{loc.easting}\t{loc.vertical}{station}\tP"
+            f"\t{self.left if self.left is not None else -9.0}"
+            f"\t{self.right if self.right is not None else -9.0}"
+            f"\t{self.up if self.up is not None else -9.0}"
+            f"\t{self.down if self.down is not None else -9.0}"
+            f"{value}"
+        )
 
 
 class SurveyBoundsCommand(CompassPlotCommand):
@@ -206,13 +202,12 @@ class CaveBoundsCommand(CompassPlotCommand):
         """Format as PLT file syntax."""
         lb = self.bounds.lower
         ub = self.bounds.upper
-        result = (
+        dist = self.distance_to_farthest_station
+        distance = f"\tI\t{dist}" if dist is not None else ""
+        return (
             f"Z\t{lb.northing}\t{ub.northing}\t{lb.easting}"
-            f"\t{ub.easting}\t{lb.vertical}\t{ub.vertical}"
+            f"\t{ub.easting}\t{lb.vertical}\t{ub.vertical}{distance}"
         )
-        if self.distance_to_farthest_station is not None:
-            result += f"\tI\t{self.distance_to_farthest_station}"
-        return result
 
 
 class DatumCommand(CompassPlotCommand):
@@ -5,9 +5,14 @@ This module implements the parser for reading Compass plot files,
 which contain computed 3D coordinates for cave visualization.
 """
 
+import functools
 import re
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
 from datetime import date
 from decimal import Decimal
+from decimal import InvalidOperation
 from pathlib import Path
 
 from compass_lib.constants import ASCII_ENCODING
@@ -29,6 +34,35 @@ from compass_lib.plot.models import FeatureCommand
 from compass_lib.plot.models import SurveyBoundsCommand
 from compass_lib.plot.models import UtmZoneCommand
 
+# Field names of the fixed numeric columns, used to report malformed tokens.
+_LOCATION_FIELDS = ("northing", "easting", "vertical")
+_DRAW_LRUD_FIELDS = ("left", "up", "down", "right")
+_FEATURE_LRUD_FIELDS = ("left", "right", "up", "down")
+_BOUNDS_FIELDS = (
+    "min northing",
+    "max northing",
+    "min easting",
+    "max easting",
+    "min vertical",
+    "max vertical",
+)
+
+# Token count of a station draw line: `n e v S<name> P l u d r I dist`.
+_STATION_DRAW_TOKENS = 11
+
+
+def _lrud_or_none(value: float) -> float | None:
+    """Return None for missing LRUD indicators (negative or 999/999.9)."""
+    if value < 0 or value in NULL_LRUD_VALUES:
+        return None
+    return value
+
+
+@functools.lru_cache(maxsize=4096)
+def _to_decimal(token: str) -> Decimal:
+    """Memoized `Decimal(token)`; Decimals are immutable so sharing is safe."""
+    return Decimal(token)
+
 
 class CompassPlotParser:
     """Parser for Compass .PLT plot files.
@@ -52,6 +86,9 @@ class CompassPlotParser:
         self.errors: list[CompassParseError] = []
         self.commands: list[CompassPlotCommand] = []
         self._source: str = "<string>"
+        # One shared str object per distinct station/survey/feature/section
+        # name: stations are referenced by many M/D/L lines.
+        self._names: dict[str, str] = {}
 
     def _add_error(
         self,
@@ -95,6 +132,12 @@ class CompassPlotParser:
             )
         )
 
+    def _intern_name(self, name: str | None) -> str | None:
+        """Return the parser's shared instance of `name` (None passes through)."""
+        if name is None:
+            return None
+        return self._names.setdefault(name, name)
+
     def parse_file(self, path: Path) -> list[CompassPlotCommand]:
         """Parse a plot file.
 
@@ -104,10 +147,25 @@ class CompassPlotParser:
         Returns:
             List of parsed commands
         """
-        self._source = str(path)
         with path.open(mode="r", encoding=ASCII_ENCODING, errors="replace") as f:
             return self.parse_lines(f, str(path))
 
+    def parse_file_iter(self, path: Path) -> Iterator[CompassPlotCommand]:
+        """Parse a plot file lazily, yielding commands as they are read.
+
+        Unlike `parse_file`, commands are not accumulated in `self.commands`,
+        so memory use stays constant regardless of the file size. Errors are
+        still collected in `self.errors`.
+
+        Args:
+            path: Path to the .PLT file
+
+        Yields:
+            Parsed commands, in file order
+        """
+        with path.open(mode="r", encoding=ASCII_ENCODING, errors="replace") as f:
+            yield from self.iter_lines(f, str(path))
+
     def parse_string(
         self,
         data: str,
@@ -122,67 +180,62 @@ class CompassPlotParser:
         Returns:
             List of parsed commands
         """
-        self._source = source
-        lines = data.split("\n")
-        return self._parse_lines_list(lines, source)
+        return self.parse_lines(data.split("\n"), source)
 
     def parse_lines(
         self,
-        file_obj,
+        file_obj: Iterable[str],
         source: str = "<string>",
     ) -> list[CompassPlotCommand]:
         """Parse plot data from a file object.
 
         Args:
-            file_obj: File-like object to read from
+            file_obj: File-like object (or any iterable of lines) to read from
             source: Source identifier for error messages
 
         Returns:
             List of parsed commands
         """
-        self._source = source
-        commands: list[CompassPlotCommand] = []
-
-        for line_num, line in enumerate(file_obj):
-            _line = line.strip()
-            if not _line:
-                continue
-
-            try:
-                command = self._parse_command(_line, line_num)
-                if command:
-                    commands.append(command)
-            except Exception as e:  # noqa: BLE001
-                self._add_error(str(e), _line, line_num)
-
+        commands = list(self.iter_lines(file_obj, source))
         self.commands.extend(commands)
         return commands
 
-    def _parse_lines_list(
+    def iter_lines(
         self,
-        lines: list[str],
-        source: str,
-    ) -> list[CompassPlotCommand]:
-        """Parse lines from a list."""
+        file_obj: Iterable[str],
+        source: str = "<string>",
+    ) -> Iterator[CompassPlotCommand]:
+        """Parse plot data from a file object, yielding commands one by one.
+
+        Args:
+            file_obj: File-like object (or any iterable of lines) to read from
+            source: Source identifier for error messages
+
+        Yields:
+            Parsed commands, in input order
+        """
         self._source = source
-        commands: list[CompassPlotCommand] = []
+        parsers = self._COMMAND_PARSERS
 
-        for line_num, line in enumerate(lines):
+        for line_num, line in enumerate(file_obj):
             _line = line.strip()
-            if not _line:
+
+            # Fast path: blank lines and unknown commands (`_line[:1]` is "" or
+            # not a command letter) are skipped without entering the parser.
+            parse = parsers.get(_line[:1])
+            if parse is None:
                 continue
 
             try:
-                command = self._parse_command(_line, line_num)
-                if command:
-                    commands.append(command)
+                command = parse(self, _line[1:], line_num)
             except Exception as e:  # noqa: BLE001
                 self._add_error(str(e), _line, line_num)
+                continue
 
-        self.commands.extend(commands)
-        return commands
+            if command:
+                yield command
 
-    def _parse_command(  # noqa: PLR0911
+    def _parse_command(
         self,
         line: str,
         line_num: int,
@@ -196,33 +249,12 @@ class CompassPlotParser:
         Returns:
             Parsed command or None if unknown/invalid
         """
-        if not line:
+        parse = self._COMMAND_PARSERS.get(line[:1])
+        if parse is None:
+            # Unknown command - ignore silently (many undocumented commands exist)
             return None
 
-        cmd = line[0]
-        rest = line[1:]
-
-        if cmd in ("M", "D"):
-            return self._parse_draw_command(cmd, rest, line_num)
-        if cmd == "N":
-            return self._parse_begin_survey(rest, line_num)
-        if cmd == "F":
-            return self._parse_begin_feature(rest, line_num)
-        if cmd == "S":
-            return self._parse_begin_section(rest, line_num)
-        if cmd == "L":
-            return self._parse_feature_command(rest, line_num)
-        if cmd == "X":
-            return self._parse_survey_bounds(rest, line_num)
-        if cmd == "Z":
-            return self._parse_cave_bounds(rest, line_num)
-        if cmd == "O":
-            return self._parse_datum(rest, line_num)
-        if cmd == "G":
-            return self._parse_utm_zone(rest, line_num)
-
-        # Unknown command - ignore silently (many undocumented commands exist)
-        return None
+        return parse(self, line[1:], line_num)
 
     def _parse_number(
         self,
@@ -238,25 +270,39 @@ class CompassPlotParser:
             self._add_error(f"invalid {field_name}: {text}", text, line_num)
             return None
 
-    def _parse_lrud(
+    def _parse_numbers(
         self,
-        text: str,
+        tokens: list[str],
         line_num: int,
-        field_name: str,
-    ) -> float | None:
-        """Parse LRUD measurement.
+        field_names: tuple[str, ...],
+    ) -> list[float | None]:
+        """Parse consecutive numeric tokens, one per name in `field_names`.
 
-        Returns None for missing data indicators (negative or 999/999.9).
+        All tokens are converted in a single pass; only if one of them is
+        malformed are they re-parsed one by one to report the failing field.
         """
-        value = self._parse_number(text, line_num, field_name)
-        if value is None:
-            return None
+        try:
+            return list(map(float, tokens))
+        except ValueError:
+            return [
+                self._parse_number(token, line_num, name)
+                for token, name in zip(tokens, field_names, strict=True)
+            ]
 
-        # Null indicators
-        if value < 0 or value in NULL_LRUD_VALUES:
-            return None
+    def _parse_lruds(
+        self,
+        tokens: list[str],
+        line_num: int,
+        field_names: tuple[str, ...],
+    ) -> list[float | None]:
+        """Parse LRUD measurements.
 
-        return value
+        Returns None for missing data indicators (negative or 999/999.9).
+        """
+        return [
+            None if value is None else _lrud_or_none(value)
+            for value in self._parse_numbers(tokens, line_num, field_names)
+        ]
 
     def _parse_date(
         self,
@@ -294,12 +340,12 @@ class CompassPlotParser:
 
     def _parse_draw_command(
         self,
-        cmd: str,
         rest: str,
         line_num: int,
+        *,
+        operation: DrawOperation,
     ) -> DrawSurveyCommand | None:
         """Parse M (move) or D (draw) command."""
-        operation = DrawOperation.MOVE_TO if cmd == "M" else DrawOperation.LINE_TO
         parts = rest.split()
 
         if len(parts) < 3:
@@ -310,9 +356,20 @@ class CompassPlotParser:
             )
             return None
 
-        northing = self._parse_number(parts[0], line_num, "northing")
-        easting = self._parse_number(parts[1], line_num, "easting")
-        vertical = self._parse_number(parts[2], line_num, "vertical")
+        if (
+            len(parts) >= _STATION_DRAW_TOKENS
+            and parts[4] == "P"
+            and parts[9] == "I"
+            and parts[3][0] == "S"
+            and len(parts[3]) > 1
+        ):
+            command = self._parse_station_draw(parts, operation)
+            if command is not None:
+                return command
+
+        northing, easting, vertical = self._parse_numbers(
+            parts[:3], line_num, _LOCATION_FIELDS
+        )
 
         command = DrawSurveyCommand(
             operation=operation,
@@ -323,30 +380,30 @@ class CompassPlotParser:
             ),
         )
 
-        # Parse subcommands
+        # Parse subcommands (str.split() tokens are never empty, so the tag
+        # letter is checked with a plain index instead of `startswith`)
         idx = 3
         while idx < len(parts):
             subcmd = parts[idx]
             idx += 1
 
-            if subcmd.startswith("S"):
+            if subcmd[0] == "S":
                 # Station name
-                command.station_name = subcmd[1:] if len(subcmd) > 1 else None
-                if not command.station_name and idx < len(parts):
-                    command.station_name = parts[idx]
+                station_name = subcmd[1:] if len(subcmd) > 1 else None
+                if not station_name and idx < len(parts):
+                    station_name = parts[idx]
                     idx += 1
+                command.station_name = self._intern_name(station_name)
 
             elif subcmd == "P":
                 # LRUD: left, up, down, right (in this order for draw commands)
                 if idx + 3 < len(parts):
-                    command.left = self._parse_lrud(parts[idx], line_num, "left")
-                    idx += 1
-                    command.up = self._parse_lrud(parts[idx], line_num, "up")
-                    idx += 1
-                    command.down = self._parse_lrud(parts[idx], line_num, "down")
-                    idx += 1
-                    command.right = self._parse_lrud(parts[idx], line_num, "right")
-                    idx += 1
+                    command.left, command.up, command.down, command.right = (
+                        self._parse_lruds(
+                            parts[idx : idx + 4], line_num, _DRAW_LRUD_FIELDS
+                        )
+                    )
+                    idx += 4
 
             elif subcmd == "I":
                 # Distance from entrance
@@ -370,6 +427,38 @@ class CompassPlotParser:
 
         return command
 
+    def _parse_station_draw(
+        self,
+        parts: list[str],
+        operation: DrawOperation,
+    ) -> DrawSurveyCommand | None:
+        """Parse the `n e v S<name> P l u d r I dist` layout of a station line.
+
+        This is how Compass writes virtually every M/D line, so its eight
+        numbers are converted in one batch and the command is built in one
+        call. Returns None (deferring to the general path and its error
+        reporting) if a number is malformed or the distance is negative.
+        """
+        try:
+            northing, easting, vertical, left, up, down, right, dist = map(
+                float, (*parts[:3], *parts[5:9], parts[10])
+            )
+        except ValueError:
+            return None
+        if dist < 0:
+            return None
+
+        return DrawSurveyCommand(
+            operation=operation,
+            location=Location(northing=northing, easting=easting, vertical=vertical),
+            station_name=self._intern_name(parts[3][1:]),
+            left=_lrud_or_none(left),
+            up=_lrud_or_none(up),
+            down=_lrud_or_none(down),
+            right=_lrud_or_none(right),
+            distance_from_entrance=dist,
+        )
+
     def _parse_feature_command(
         self,
         rest: str,
@@ -386,9 +475,9 @@ class CompassPlotParser:
             )
             return None
 
-        northing = self._parse_number(parts[0], line_num, "northing")
-        easting = self._parse_number(parts[1], line_num, "easting")
-        vertical = self._parse_number(parts[2], line_num, "vertical")
+        northing, easting, vertical = self._parse_numbers(
+            parts[:3], line_num, _LOCATION_FIELDS
+        )
 
         command = FeatureCommand(
             location=Location(
@@ -404,31 +493,30 @@ class CompassPlotParser:
             subcmd = parts[idx]
             idx += 1
 
-            if subcmd.startswith("S"):
+            if subcmd[0] == "S":
                 # Station name
-                command.station_name = subcmd[1:] if len(subcmd) > 1 else None
-                if not command.station_name and idx < len(parts):
-                    command.station_name = parts[idx]
+                station_name = subcmd[1:] if len(subcmd) > 1 else None
+                if not station_name and idx < len(parts):
+                    station_name = parts[idx]
                     idx += 1
+                command.station_name = self._intern_name(station_name)
 
             elif subcmd == "P":
                 # LRUD: left, right, up, down (different order than draw!)
                 if idx + 3 < len(parts):
-                    command.left = self._parse_lrud(parts[idx], line_num, "left")
-                    idx += 1
-                    command.right = self._parse_lrud(parts[idx], line_num, "right")
-                    idx += 1
-                    command.up = self._parse_lrud(parts[idx], line_num, "up")
-                    idx += 1
-                    command.down = self._parse_lrud(parts[idx], line_num, "down")
-                    idx += 1
+                    command.left, command.right, command.up, command.down = (
+                        self._parse_lruds(
+                            parts[idx : idx + 4], line_num, _FEATURE_LRUD_FIELDS
+                        )
+                    )
+                    idx += 4
 
             elif subcmd == "V":
                 # Feature value
                 if idx < len(parts):
                     try:
-                        command.value = Decimal(parts[idx])
-                    except Exception:  # noqa: BLE001
+                        command.value = _to_decimal(parts[idx])
+                    except InvalidOperation:
                         self._add_error(
                             f"invalid value: {parts[idx]}",
                             parts[idx],
@@ -450,8 +538,7 @@ class CompassPlotParser:
             self._add_error("missing survey name", rest, line_num)
             return BeginSurveyCommand(survey_name="")
 
-        survey_name = parts[0]
-        command = BeginSurveyCommand(survey_name=survey_name)
+        command = BeginSurveyCommand(survey_name=self._intern_name(parts[0]))
 
         # Parse subcommands
         idx = 1
@@ -464,7 +551,7 @@ class CompassPlotParser:
                 parsed_date, idx = self._parse_date(parts, idx, line_num)
                 command.date = parsed_date
 
-            elif subcmd == "C" or subcmd.startswith("C"):
+            elif subcmd[0] == "C":
                 # Comment (rest of line)
                 if subcmd == "C":
                     command.comment = " ".join(parts[idx:]).strip()
@@ -481,7 +568,7 @@ class CompassPlotParser:
     ) -> BeginSectionCommand:
         """Parse S (begin section) command."""
         # Section name is the rest of the line
-        return BeginSectionCommand(section_name=rest.strip())
+        return BeginSectionCommand(section_name=self._intern_name(rest.strip()))
 
     def _parse_begin_feature(
         self,
@@ -495,8 +582,7 @@ class CompassPlotParser:
             self._add_error("missing feature name", rest, line_num)
             return BeginFeatureCommand(feature_name="")
 
-        feature_name = parts[0]
-        command = BeginFeatureCommand(feature_name=feature_name)
+        command = BeginFeatureCommand(feature_name=self._intern_name(parts[0]))
 
         # Look for R min max
         idx = 1
@@ -504,11 +590,11 @@ class CompassPlotParser:
             if parts[idx] == "R" and idx + 2 < len(parts):
                 idx += 1
                 try:
-                    command.min_value = Decimal(parts[idx])
+                    command.min_value = _to_decimal(parts[idx])
                     idx += 1
-                    command.max_value = Decimal(parts[idx])
+                    command.max_value = _to_decimal(parts[idx])
                     idx += 1
-                except Exception:  # noqa: BLE001
+                except InvalidOperation:
                     self._add_error("invalid feature range", rest, line_num)
             else:
                 idx += 1
@@ -525,27 +611,19 @@ class CompassPlotParser:
 
         Returns (Bounds, new_index) tuple.
         """
-        bounds = Bounds()
         idx = start_idx
 
-        if idx + 5 < len(parts):
-            min_n = self._parse_number(parts[idx], line_num, "min northing")
-            idx += 1
-            max_n = self._parse_number(parts[idx], line_num, "max northing")
-            idx += 1
-            min_e = self._parse_number(parts[idx], line_num, "min easting")
-            idx += 1
-            max_e = self._parse_number(parts[idx], line_num, "max easting")
-            idx += 1
-            min_v = self._parse_number(parts[idx], line_num, "min vertical")
-            idx += 1
-            max_v = self._parse_number(parts[idx], line_num, "max vertical")
-            idx += 1
-
-            bounds.lower = Location(northing=min_n, easting=min_e, vertical=min_v)
-            bounds.upper = Location(northing=max_n, easting=max_e, vertical=max_v)
+        if idx + 5 >= len(parts):
+            return Bounds(), idx
 
-        return bounds, idx
+        min_n, max_n, min_e, max_e, min_v, max_v = self._parse_numbers(
+            parts[idx : idx + 6], line_num, _BOUNDS_FIELDS
+        )
+        bounds = Bounds(
+            lower=Location(northing=min_n, easting=min_e, vertical=min_v),
+            upper=Location(northing=max_n, easting=max_e, vertical=max_v),
+        )
+        return bounds, idx + 6
 
     def _parse_survey_bounds(
         self,
@@ -608,3 +686,20 @@ class CompassPlotParser:
         """Parse G (UTM zone) command."""
         utm_zone = rest.split(maxsplit=1)[0] if rest.split() else rest.strip()
         return UtmZoneCommand(utm_zone=utm_zone)
+
+    # Command letter -> parser for the rest of the line. Built once with the
+    # class so that `_parse_command` is a single dict lookup per line.
+    _COMMAND_PARSERS: dict[
+        str, Callable[["CompassPlotParser", str, int], CompassPlotCommand | None]
+    ] = {
+        "M": functools.partial(_parse_draw_command, operation=DrawOperation.MOVE_TO),
+        "D": functools.partial(_parse_draw_command, operation=DrawOperation.LINE_TO),
+        "N": _parse_begin_survey,
+        "F": _parse_begin_feature,
+        "S": _parse_begin_section,
+        "L": _parse_feature_command,
+        "X": _parse_survey_bounds,
+        "Z": _parse_cave_bounds,
+        "O": _parse_datum,
+        "G": _parse_utm_zone,
+    }
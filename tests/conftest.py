@@ -8,14 +8,30 @@ All test files in the private directory are automatically discovered.
 from __future__ import annotations
 
 import base64
+import functools
 import logging
 import lzma
 import os
 from pathlib import Path
+from types import MappingProxyType
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
 
+import numpy as np
 import pytest
 from cryptography.hazmat.primitives.ciphers.aead import AESSIV
 
+from compass_lib import load_project
+from compass_lib.geojson import compute_survey_coordinates
+from compass_lib.geojson import survey_to_geojson
+from compass_lib.survey.models import CompassSurveyHeader
+
+if TYPE_CHECKING:
+    from geojson import FeatureCollection
+
+    from compass_lib.geojson import ComputedSurvey
+    from compass_lib.project.models import CompassMakFile
+
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
@@ -81,21 +97,125 @@ def artifacts_dir() -> Path:
     return ARTIFACTS_DIR
 
 
+@pytest.fixture(scope="session")
+def shared_tmp_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Return a temporary directory shared by the whole session.
+
+    Tests writing here must use file names that do not collide with others.
+    """
+    return tmp_path_factory.mktemp("shared")
+
+
+# =============================================================================
+# Model Fixtures
+# =============================================================================
+
+
+@pytest.fixture(scope="session")
+def header_no_bs() -> CompassSurveyHeader:
+    """Return a survey header without backsight columns.
+
+    Shared across the session: tests must not mutate it (use ``model_copy``).
+    """
+    return CompassSurveyHeader(has_backsights=False)
+
+
+@pytest.fixture(scope="session")
+def header_with_bs() -> CompassSurveyHeader:
+    """Return a survey header with backsight columns.
+
+    Shared across the session: tests must not mutate it (use ``model_copy``).
+    """
+    return CompassSurveyHeader(has_backsights=True)
+
+
+# =============================================================================
+# UTM Coordinate Fixtures (read-only: copy before changing)
+# =============================================================================
+
+
+@pytest.fixture(scope="session")
+def boulder_utm_coords() -> MappingProxyType:
+    """UTM coordinates in the Boulder, CO area (Zone 13N)."""
+    return MappingProxyType(
+        {
+            "easting": 476516.0,
+            "northing": 4429320.0,
+            "elevation": 1655.0,
+            "zone": 13,
+            "convergence": 0.0,
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def sydney_utm_coords() -> MappingProxyType:
+    """UTM coordinates in the Sydney, Australia area (Zone 56S)."""
+    return MappingProxyType(
+        {"easting": 334000.0, "northing": 6252000.0, "elevation": 50.0, "zone": -56}
+    )
+
+
+@pytest.fixture(scope="session")
+def buenos_aires_utm_coords() -> MappingProxyType:
+    """UTM coordinates in the Buenos Aires, Argentina area (Zone 21S)."""
+    return MappingProxyType(
+        {"easting": 367000.0, "northing": 6177000.0, "elevation": 25.0, "zone": -21}
+    )
+
+
+@pytest.fixture(scope="session")
+def south_africa_utm_coords() -> MappingProxyType:
+    """UTM coordinates in South Africa (Zone 35S)."""
+    return MappingProxyType(
+        {"easting": 275000.0, "northing": 6200000.0, "elevation": 1400.0, "zone": -35}
+    )
+
+
 # =============================================================================
 # File Discovery Functions (used for parametrization)
 # =============================================================================
 
 
+@functools.cache
+def _list_private_files() -> tuple[Path, ...]:
+    """Return the sorted regular files of the private directory.
+
+    The directory is scanned once (after decryption) and every discovery
+    function below filters this listing rather than globbing it again.
+    """
+    if not PRIVATE_DATA_DIR.exists():
+        return ()
+    with os.scandir(PRIVATE_DATA_DIR) as entries:
+        return tuple(sorted(Path(entry.path) for entry in entries if entry.is_file()))
+
+
+def _private_files(suffix: str) -> list[Path]:
+    """Return the private files whose name ends with `suffix` (case-sensitive)."""
+    return [path for path in _list_private_files() if path.name.endswith(suffix)]
+
+
+# Tests driven by the private artifacts are marked `slow` so that the inner
+# development loop can deselect them with `pytest -m "not slow"`.
+_PRIVATE_MARK = pytest.mark.slow
+
+
 def discover_mak_files() -> list[pytest.param]:
     """Discover all MAK files in the private directory.
 
     Returns:
         List of pytest.param objects for use with @pytest.mark.parametrize
     """
-    if not PRIVATE_DATA_DIR.exists():
-        return []
-    mak_files = sorted(PRIVATE_DATA_DIR.glob("*.mak"))
-    return [pytest.param(mak_file, id=mak_file.stem) for mak_file in mak_files]
+    # Group by file so that, under `--dist=loadgroup`, every test for a given
+    # project runs on the same xdist worker and hits that worker's caches.
+    return [
+        pytest.param(
+            mak_file,
+            id=mak_file.stem,
+            marks=[_PRIVATE_MARK, pytest.mark.xdist_group(mak_file.stem)],
+        )
+        for mak_file in _private_files(".mak")
+    ]
 
 
 def discover_dat_files() -> list[pytest.param]:
@@ -104,10 +224,10 @@ def discover_dat_files() -> list[pytest.param]:
     Returns:
         List of pytest.param objects for use with @pytest.mark.parametrize
     """
-    if not PRIVATE_DATA_DIR.exists():
-        return []
-    dat_files = sorted(PRIVATE_DATA_DIR.glob("*.dat"))
-    return [pytest.param(dat_file, id=dat_file.stem) for dat_file in dat_files]
+    return [
+        pytest.param(dat_file, id=dat_file.stem, marks=_PRIVATE_MARK)
+        for dat_file in _private_files(".dat")
+    ]
 
 
 def discover_mak_json_files() -> list[pytest.param]:
@@ -116,10 +236,10 @@ def discover_mak_json_files() -> list[pytest.param]:
     Returns:
         List of pytest.param objects for use with @pytest.mark.parametrize
     """
-    if not PRIVATE_DATA_DIR.exists():
-        return []
-    json_files = sorted(PRIVATE_DATA_DIR.glob("*.mak.json"))
-    return [pytest.param(json_file, id=json_file.stem) for json_file in json_files]
+    return [
+        pytest.param(json_file, id=json_file.stem, marks=_PRIVATE_MARK)
+        for json_file in _private_files(".mak.json")
+    ]
 
 
 def discover_dat_json_files() -> list[pytest.param]:
@@ -128,10 +248,10 @@ def discover_dat_json_files() -> list[pytest.param]:
     Returns:
         List of pytest.param objects for use with @pytest.mark.parametrize
     """
-    if not PRIVATE_DATA_DIR.exists():
-        return []
-    json_files = sorted(PRIVATE_DATA_DIR.glob("*.dat.json"))
-    return [pytest.param(json_file, id=json_file.stem) for json_file in json_files]
+    return [
+        pytest.param(json_file, id=json_file.stem, marks=_PRIVATE_MARK)
+        for json_file in _private_files(".dat.json")
+    ]
 
 
 def discover_geojson_files() -> list[pytest.param]:
@@ -140,29 +260,32 @@ def discover_geojson_files() -> list[pytest.param]:
     Returns:
         List of pytest.param objects for use with @pytest.mark.parametrize
     """
-    if not PRIVATE_DATA_DIR.exists():
-        return []
-    geojson_files = sorted(PRIVATE_DATA_DIR.glob("*.geojson"))
     return [
-        pytest.param(geojson_file, id=geojson_file.stem)
-        for geojson_file in geojson_files
+        pytest.param(geojson_file, id=geojson_file.stem, marks=_PRIVATE_MARK)
+        for geojson_file in _private_files(".geojson")
     ]
 
 
+def _discover_with_sibling(suffix: str, sibling_suffix: str) -> list[pytest.param]:
+    """Pair each `suffix` file with its `sibling_suffix` file, when present."""
+    existing = set(_list_private_files())
+    params = []
+    for path in _private_files(suffix):
+        sibling = path.with_suffix(sibling_suffix)
+        if sibling in existing:
+            params.append(
+                pytest.param(path, sibling, id=path.stem, marks=_PRIVATE_MARK)
+            )
+    return params
+
+
 def discover_mak_with_json_baseline() -> list[pytest.param]:
     """Discover MAK files that have corresponding JSON baselines.
 
     Returns:
         List of pytest.param objects with (mak_path, json_path) tuples
     """
-    if not PRIVATE_DATA_DIR.exists():
-        return []
-    params = []
-    for mak_file in sorted(PRIVATE_DATA_DIR.glob("*.mak")):
-        json_file = mak_file.with_suffix(".mak.json")
-        if json_file.exists():
-            params.append(pytest.param(mak_file, json_file, id=mak_file.stem))
-    return params
+    return _discover_with_sibling(".mak", ".mak.json")
 
 
 def discover_dat_with_json_baseline() -> list[pytest.param]:
@@ -171,14 +294,7 @@ def discover_dat_with_json_baseline() -> list[pytest.param]:
     Returns:
         List of pytest.param objects with (dat_path, json_path) tuples
     """
-    if not PRIVATE_DATA_DIR.exists():
-        return []
-    params = []
-    for dat_file in sorted(PRIVATE_DATA_DIR.glob("*.dat")):
-        json_file = dat_file.with_suffix(".dat.json")
-        if json_file.exists():
-            params.append(pytest.param(dat_file, json_file, id=dat_file.stem))
-    return params
+    return _discover_with_sibling(".dat", ".dat.json")
 
 
 def discover_mak_with_geojson() -> list[pytest.param]:
@@ -187,22 +303,18 @@ def discover_mak_with_geojson() -> list[pytest.param]:
     Returns:
         List of pytest.param objects with (mak_path, geojson_path) tuples
     """
-    if not PRIVATE_DATA_DIR.exists():
-        return []
-    params = []
-    for mak_file in sorted(PRIVATE_DATA_DIR.glob("*.mak")):
-        geojson_file = mak_file.with_suffix(".geojson")
-        if geojson_file.exists():
-            params.append(pytest.param(mak_file, geojson_file, id=mak_file.stem))
-    return params
+    return _discover_with_sibling(".mak", ".geojson")
 
 
 # =============================================================================
 # Pre-computed Parameter Lists (for module-level parametrize decorators)
 # =============================================================================
 
-# Decrypt artifacts before discovery (must happen at import time, before parametrize)
-_decrypt_artifacts()
+# Decrypt artifacts before discovery (must happen at import time, before parametrize).
+# Under pytest-xdist the controller imports this module before spawning workers,
+# so workers skip decryption instead of rewriting the same files concurrently.
+if "PYTEST_XDIST_WORKER" not in os.environ:
+    _decrypt_artifacts()
 
 # These are computed at import time for use with @pytest.mark.parametrize
 ALL_MAK_FILES = discover_mak_files()
@@ -214,8 +326,246 @@ MAK_WITH_JSON_BASELINE = discover_mak_with_json_baseline()
 DAT_WITH_JSON_BASELINE = discover_dat_with_json_baseline()
 MAK_WITH_GEOJSON = discover_mak_with_geojson()
 
-# First MAK file for single-file tests (may be None if no files exist)
-FIRST_MAK = PRIVATE_DATA_DIR / "project001.mak" if PRIVATE_DATA_DIR.exists() else None
+# First MAK file for single-file tests (None if it is not in the private listing)
+FIRST_MAK = next(
+    (path for path in _private_files(".mak") if path.name == "project001.mak"), None
+)
+
+
+# =============================================================================
+# Cached Pipelines (shared by tests parametrized over ``mak_path``)
+# =============================================================================
+
+# Loading a project and computing its coordinates dominates the runtime of
+# the parametrized GeoJSON tests, so each MAK file is processed once per
+# session (per xdist worker) and the results are shared. Entries are keyed on
+# the file's mtime so an artifact rewritten mid-session is reloaded. Consumers
+# must treat the cached objects as read-only.
+_CacheKey = tuple[Path, int]
+
+_project_cache: dict[_CacheKey, CompassMakFile] = {}
+_survey_cache: dict[_CacheKey, ComputedSurvey] = {}
+_geojson_cache: dict[_CacheKey, FeatureCollection] = {}
+_full_geojson_cache: dict[_CacheKey, FeatureCollection] = {}
+_features_cache: dict[tuple[Path, int, bool], SimpleNamespace] = {}
+_stations_cache: dict[_CacheKey, frozenset[str]] = {}
+
+
+def _cache_key(mak_path: Path) -> _CacheKey:
+    return mak_path, mak_path.stat().st_mtime_ns
+
+
+# The public getters stat the file once to build the key; the private helpers
+# below take that key so a cache miss deep in the chain does not stat again.
+def _project(key: _CacheKey) -> CompassMakFile:
+    if key not in _project_cache:
+        _project_cache[key] = load_project(key[0])
+    return _project_cache[key]
+
+
+def _survey(key: _CacheKey) -> ComputedSurvey:
+    if key not in _survey_cache:
+        _survey_cache[key] = compute_survey_coordinates(_project(key))
+    return _survey_cache[key]
+
+
+def _geojson(key: _CacheKey) -> FeatureCollection:
+    if key not in _geojson_cache:
+        _geojson_cache[key] = survey_to_geojson(_survey(key))
+    return _geojson_cache[key]
+
+
+def _full_geojson(key: _CacheKey) -> FeatureCollection:
+    if key not in _full_geojson_cache:
+        _full_geojson_cache[key] = survey_to_geojson(
+            _survey(key), include_passages=True, include_anchors=True
+        )
+    return _full_geojson_cache[key]
+
+
+def get_project(mak_path: Path) -> CompassMakFile:
+    """Return the loaded project for `mak_path`, loading it on first use."""
+    return _project(_cache_key(mak_path))
+
+
+def get_project_stations(mak_path: Path) -> frozenset[str]:
+    """Return the station names of the cached project for `mak_path`."""
+    key = _cache_key(mak_path)
+    if key not in _stations_cache:
+        _stations_cache[key] = frozenset(_project(key).get_all_stations())
+    return _stations_cache[key]
+
+
+def get_survey(mak_path: Path) -> ComputedSurvey:
+    """Return the computed survey for `mak_path`, computing it on first use."""
+    return _survey(_cache_key(mak_path))
+
+
+def get_geojson(mak_path: Path) -> FeatureCollection:
+    """Return the default GeoJSON for `mak_path`, building it on first use.
+
+    Equivalent to ``project_to_geojson(project)`` but reuses the cached survey.
+    """
+    return _geojson(_cache_key(mak_path))
+
+
+def get_full_geojson(mak_path: Path) -> FeatureCollection:
+    """Return the GeoJSON for `mak_path` with passages and anchors included.
+
+    This is the superset of every export variant the tests inspect; tests
+    needing fewer feature kinds filter it instead of exporting again.
+    """
+    return _full_geojson(_cache_key(mak_path))
+
+
+def split_features(geojson: FeatureCollection) -> SimpleNamespace:
+    """Split `geojson` features by kind in a single pass.
+
+    Besides the feature lists, per-feature values the tests compare are
+    gathered into NumPy arrays (struct-of-arrays) so assertions are
+    vectorized; names and ids stay plain lists for error reporting.
+
+    Returns:
+        Namespace with:
+        - ``full``: the collection itself.
+        - ``stations`` (``type`` is ``"station"``), ``legs`` (LineStrings with an
+          ``id``), ``polygons`` and ``by_type`` (grouped by geometry type).
+        - ``station_names``, ``station_coords`` (``(N, 3)`` lon/lat/elevation,
+          NaN where a coordinate is missing) and ``station_elevation_m``.
+        - ``point_dims`` / ``leg_dims`` / ``coord_dims``: length of every Point,
+          leg and any-geometry coordinate tuple.
+        - ``depth_ids``, ``depths`` and ``depth_elev``: id, ``depth`` property and
+          Z coordinate (last vertex for legs) of Point/LineString features that
+          have a depth.
+    """
+    stations = []
+    legs = []
+    by_type: dict[str, list] = {}
+    station_names: list[str] = []
+    station_coords: list[tuple[float, float, float]] = []
+    station_elevation_m: list[float] = []
+    point_dims: list[int] = []
+    leg_dims: list[int] = []
+    coord_dims: list[int] = []
+    depth_ids: list[str] = []
+    depths: list = []
+    depth_elev: list[float] = []
+
+    for feature in geojson["features"]:
+        geom = feature["geometry"]
+        geom_type = geom["type"]
+        coords = geom["coordinates"]
+        props = feature["properties"]
+        by_type.setdefault(geom_type, []).append(feature)
+
+        if geom_type == "Point":
+            point_dims.append(len(coords))
+            coord_dims.append(len(coords))
+            last = coords
+            if props.get("type") == "station":
+                stations.append(feature)
+                station_names.append(props["name"])
+                padded = (*coords[:3], np.nan, np.nan, np.nan)
+                station_coords.append(padded[:3])
+                station_elevation_m.append(props["elevation_m"])
+        elif geom_type == "LineString":
+            dims = [len(c) for c in coords]
+            coord_dims.extend(dims)
+            if "id" in props:
+                legs.append(feature)
+                leg_dims.extend(dims)
+            last = coords[-1]
+        else:
+            if geom_type == "Polygon":
+                coord_dims.extend(len(c) for ring in coords for c in ring)
+            continue
+
+        if "depth" in props:
+            depth_ids.append(props.get("id", props.get("name")))
+            depths.append(props["depth"])
+            depth_elev.append(last[2] if len(last) > 2 else np.nan)
+
+    return SimpleNamespace(
+        full=geojson,
+        stations=stations,
+        legs=legs,
+        polygons=by_type.get("Polygon", []),
+        by_type=by_type,
+        station_names=station_names,
+        station_coords=np.array(station_coords, dtype=np.float64).reshape(-1, 3),
+        station_elevation_m=np.array(station_elevation_m, dtype=np.float64),
+        point_dims=np.array(point_dims, dtype=np.intp),
+        leg_dims=np.array(leg_dims, dtype=np.intp),
+        coord_dims=np.array(coord_dims, dtype=np.intp),
+        depth_ids=depth_ids,
+        # No dtype: a non-numeric depth shows up as a non-numeric array kind.
+        depths=np.asarray(depths),
+        depth_elev=np.array(depth_elev, dtype=np.float64),
+    )
+
+
+def get_features(mak_path: Path, *, full: bool = False) -> SimpleNamespace:
+    """Return `split_features` of the cached GeoJSON for `mak_path`.
+
+    With `full`, splits the passages+anchors export (`get_full_geojson`)
+    instead of the default one.
+    """
+    key = _cache_key(mak_path)
+    features_key = (*key, full)
+    if features_key not in _features_cache:
+        geojson = _full_geojson(key) if full else _geojson(key)
+        _features_cache[features_key] = split_features(geojson)
+    return _features_cache[features_key]
+
+
+@pytest.fixture
+def loaded_project(mak_path: Path) -> CompassMakFile:
+    """Return the cached project for the parametrized `mak_path`."""
+    return get_project(mak_path)
+
+
+@pytest.fixture
+def project_stations(mak_path: Path) -> frozenset[str]:
+    """Return the cached station names for the parametrized `mak_path`."""
+    return get_project_stations(mak_path)
+
+
+@pytest.fixture
+def computed_survey(mak_path: Path) -> ComputedSurvey:
+    """Return the cached computed survey for the parametrized `mak_path`."""
+    return get_survey(mak_path)
+
+
+@pytest.fixture
+def project_features(mak_path: Path) -> SimpleNamespace:
+    """Return the cached, split default GeoJSON for the parametrized `mak_path`."""
+    return get_features(mak_path)
+
+
+@pytest.fixture
+def project_full_features(mak_path: Path) -> SimpleNamespace:
+    """Return the cached, split passages+anchors GeoJSON for `mak_path`."""
+    return get_features(mak_path, full=True)
+
+
+@pytest.fixture(scope="class")
+def first_survey() -> ComputedSurvey:
+    """Return the cached computed survey for `FIRST_MAK`, skipping if absent."""
+    if FIRST_MAK is None:
+        pytest.skip("No test file")
+    return get_survey(FIRST_MAK)
+
+
+@pytest.fixture(scope="class")
+def first_features(first_survey: ComputedSurvey) -> SimpleNamespace:
+    """Return the cached, split default GeoJSON for `FIRST_MAK`."""
+    return get_features(FIRST_MAK)
+
+
+@pytest.fixture(scope="class")
+def first_full_features(first_survey: ComputedSurvey) -> SimpleNamespace:
+    """Return the cached, split passages+anchors GeoJSON for `FIRST_MAK`."""
+    return get_features(FIRST_MAK, full=True)
 
 
 # =============================================================================
@@ -226,44 +576,62 @@ FIRST_MAK = PRIVATE_DATA_DIR / "project001.mak" if PRIVATE_DATA_DIR.exists() els
 @pytest.fixture
 def all_mak_paths() -> list[Path]:
     """Return list of all MAK file paths."""
-    if not PRIVATE_DATA_DIR.exists():
-        return []
-    return sorted(PRIVATE_DATA_DIR.glob("*.mak"))
+    return _private_files(".mak")
 
 
 @pytest.fixture
 def all_dat_paths() -> list[Path]:
     """Return list of all DAT file paths."""
-    if not PRIVATE_DATA_DIR.exists():
-        return []
-    return sorted(PRIVATE_DATA_DIR.glob("*.dat"))
+    return _private_files(".dat")
 
 
 @pytest.fixture
 def all_mak_json_paths() -> list[Path]:
     """Return list of all MAK JSON file paths."""
-    if not PRIVATE_DATA_DIR.exists():
-        return []
-    return sorted(PRIVATE_DATA_DIR.glob("*.mak.json"))
+    return _private_files(".mak.json")
 
 
 @pytest.fixture
 def all_dat_json_paths() -> list[Path]:
     """Return list of all DAT JSON file paths."""
-    if not PRIVATE_DATA_DIR.exists():
-        return []
-    return sorted(PRIVATE_DATA_DIR.glob("*.dat.json"))
+    return _private_files(".dat.json")
 
 
 @pytest.fixture
 def all_geojson_paths() -> list[Path]:
     """Return list of all GeoJSON file paths."""
-    if not PRIVATE_DATA_DIR.exists():
-        return []
-    return sorted(PRIVATE_DATA_DIR.glob("*.geojson"))
+    return _private_files(".geojson")
 
 
 @pytest.fixture
 def first_mak_path() -> Path | None:
     """Return the first MAK file path, or None if not available."""
-    return FIRST_MAK if FIRST_MAK and FIRST_MAK.exists() else None
+    return FIRST_MAK
+
+
+# =============================================================================
+# Collection Hooks
+# =============================================================================
+
+# Fixtures that read the private artifacts without going through a discovered
+# (and therefore already `slow`-marked) parameter.
+_PRIVATE_FIXTURES = frozenset(
+    {
+        "first_survey",
+        "first_features",
+        "first_full_features",
+        "first_mak_path",
+        "all_mak_paths",
+        "all_dat_paths",
+        "all_mak_json_paths",
+        "all_dat_json_paths",
+        "all_geojson_paths",
+    }
+)
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Mark tests that depend on a private-artifact fixture as `slow`."""
+    for item in items:
+        if _PRIVATE_FIXTURES.intersection(getattr(item, "fixturenames", ())):
+            item.add_marker(_PRIVATE_MARK)
@@ -7,7 +7,6 @@ MAK + DAT => JSON => MAK + DAT => JSON
 All test files are sourced from tests/artifacts/private/.
 """
 
-import json
 import shutil
 import tempfile
 from pathlib import Path
@@ -209,7 +208,7 @@ class TestBaselineConsistency:
         """Test MAK to JSON conversion matches stored baseline."""
         # Load and convert MAK
         project = load_project(mak_path)
-        result = json.loads(project.model_dump_json(by_alias=True))
+        result = orjson.loads(project.model_dump_json(by_alias=True))
 
         # Load baseline
         baseline = orjson.loads(json_baseline.read_bytes())
@@ -228,7 +227,7 @@ class TestBaselineConsistency:
         result = {
             "version": "1.0",
             "format": FormatIdentifier.COMPASS_DAT.value,
-            "surveys": json.loads(dat_file_obj.model_dump_json(by_alias=True))[
+            "surveys": orjson.loads(dat_file_obj.model_dump_json(by_alias=True))[
                 "surveys"
             ],
         }
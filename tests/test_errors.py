@@ -1,4 +1,3 @@
-# -*- coding: utf-8 -*-
 """Tests for errors module."""
 
 import pytest
@@ -53,6 +52,8 @@ class TestSourceLocation:
 class TestCompassParseError:
     """Tests for CompassParseError dataclass (error record)."""
 
+    _EXPECTED_WITH_LOCATION = ("error:", "Invalid value", "test.dat", "bad data")
+
     def test_creation(self):
         """Test creating a parse error."""
         error = CompassParseError(
@@ -102,10 +103,7 @@ class TestCompassParseError:
             location=loc,
         )
         result = str(error)
-        assert "error:" in result
-        assert "Invalid value" in result
-        assert "test.dat" in result
-        assert "bad data" in result
+        assert all(n in result for n in self._EXPECTED_WITH_LOCATION)
 
     def test_warning_severity(self):
         """Test warning severity."""
@@ -1,6 +1,6 @@
-# -*- coding: utf-8 -*-
 """Tests for formatting (serialization) modules."""
 
+import re
 from datetime import date
 
 import pytest
@@ -21,192 +21,154 @@ from compass_lib.survey.models import CompassShot
 from compass_lib.survey.models import CompassSurvey
 from compass_lib.survey.models import CompassSurveyHeader
 
+# Expected output fragments, matched in a single pass over the formatted text.
+# Shot and header output is pure ASCII, so those tests check the encoded bytes.
+_SHOT_BASIC_RE = re.compile(rb"A1\s+A2\s+10\.50\s+45\.00\s+-5\.00")
+_HEADER_CORRECTIONS_RE = re.compile(rb"CORRECTIONS: 2\.00 3\.00 4\.00")
+_MAK_DIRECTIVES_RE = re.compile(
+    r"&North American 1983;.*\$13;.*#ENTRANCE\.DAT;", re.DOTALL
+)
+
+# Shared baseline models; tests derive variants with ``model_copy(update=...)``
+# instead of re-validating a full set of constructor kwargs each time.
+_BASE_SHOT = CompassShot(
+    from_station_name="A1",
+    to_station_name="A2",
+    length=10.0,
+    frontsight_azimuth=45.0,
+    frontsight_inclination=-5.0,
+)
+_BASE_HEADER = CompassSurveyHeader(
+    cave_name="SECRET CAVE",
+    survey_name="A",
+    date=date(1979, 7, 10),
+    declination=1.0,
+)
+_BASE_HEADER_NO_BS = _BASE_HEADER.model_copy(update={"has_backsights": False})
+
 
 class TestFormatShot:
     """Tests for format_shot function."""
 
-    def test_basic_shot(self):
+    def test_basic_shot(self, header_no_bs):
         """Test formatting a basic shot."""
-        header = CompassSurveyHeader(has_backsights=False)
-        shot = CompassShot(
-            from_station_name="A1",
-            to_station_name="A2",
-            length=10.5,
-            frontsight_azimuth=45.0,
-            frontsight_inclination=-5.0,
-            left=1.0,
-            right=2.0,
-            up=3.0,
-            down=0.5,
+        shot = _BASE_SHOT.model_copy(
+            update={"length": 10.5, "left": 1.0, "right": 2.0, "up": 3.0, "down": 0.5}
         )
-        result = format_shot(shot, header)
+        result = format_shot(shot, header_no_bs).encode("ascii")
 
-        assert "A1" in result
-        assert "A2" in result
-        assert "10.50" in result
-        assert "45.00" in result
-        assert "-5.00" in result
-        assert result.endswith("\r\n")
+        assert _SHOT_BASIC_RE.search(result)
+        assert result.endswith(b"\r\n")
 
-    def test_shot_with_missing_values(self):
+    def test_shot_with_missing_values(self, header_no_bs):
         """Test formatting a shot with missing values."""
-        header = CompassSurveyHeader(has_backsights=False)
-        shot = CompassShot(
-            from_station_name="A1",
-            to_station_name="A2",
-            length=10.0,
-            frontsight_azimuth=45.0,
-            frontsight_inclination=None,  # Missing
-            left=None,  # Missing
-            right=None,  # Missing
-            up=None,  # Missing
-            down=None,  # Missing
-        )
-        result = format_shot(shot, header)
+        # Inclination and LRUDs are missing
+        shot = _BASE_SHOT.model_copy(update={"frontsight_inclination": None})
+        result = format_shot(shot, header_no_bs).encode("ascii")
 
         # Should contain -999.00 for missing values
-        assert "-999.00" in result
+        assert b"-999.00" in result
 
-    def test_shot_with_backsights(self):
+    def test_shot_with_backsights(self, header_with_bs):
         """Test formatting a shot with backsights."""
-        header = CompassSurveyHeader(has_backsights=True)
-        shot = CompassShot(
-            from_station_name="A1",
-            to_station_name="A2",
-            length=10.0,
-            frontsight_azimuth=45.0,
-            frontsight_inclination=-5.0,
-            backsight_azimuth=225.0,
-            backsight_inclination=5.0,
+        shot = _BASE_SHOT.model_copy(
+            update={"backsight_azimuth": 225.0, "backsight_inclination": 5.0}
         )
-        result = format_shot(shot, header)
+        result = format_shot(shot, header_with_bs).encode("ascii")
 
-        assert "225.00" in result
-        assert "5.00" in result
+        assert b"225.00" in result
+        assert b"5.00" in result
 
-    def test_shot_with_flags(self):
+    def test_shot_with_flags(self, header_no_bs):
         """Test formatting a shot with flags."""
-        header = CompassSurveyHeader(has_backsights=False)
-        shot = CompassShot(
-            from_station_name="A1",
-            to_station_name="A2",
-            length=10.0,
-            frontsight_azimuth=45.0,
-            frontsight_inclination=-5.0,
-            excluded_from_length=True,
-            excluded_from_plotting=True,
+        shot = _BASE_SHOT.model_copy(
+            update={"excluded_from_length": True, "excluded_from_plotting": True}
         )
-        result = format_shot(shot, header)
+        result = format_shot(shot, header_no_bs).encode("ascii")
 
-        assert "#|LP#" in result
+        assert b"#|LP#" in result
 
-    def test_shot_with_comment(self):
+    def test_shot_with_comment(self, header_no_bs):
         """Test formatting a shot with comment."""
-        header = CompassSurveyHeader(has_backsights=False)
-        shot = CompassShot(
-            from_station_name="A1",
-            to_station_name="A2",
-            length=10.0,
-            frontsight_azimuth=45.0,
-            frontsight_inclination=-5.0,
-            comment="Big Room",
-        )
-        result = format_shot(shot, header)
-
-        assert "Big Room" in result
-
-    def test_invalid_station_name_raises(self):
+        shot = _BASE_SHOT.model_copy(update={"comment": "Big Room"})
+        result = format_shot(shot, header_no_bs).encode("ascii")
+
+        assert b"Big Room" in result
+
+    @pytest.mark.parametrize(
+        ("shot", "expected_exc"),
+        [
+            pytest.param(
+                _BASE_SHOT.model_copy(update={"from_station_name": "A 1"}),
+                ValueError,
+                id="from_station_space",
+            ),
+            pytest.param(
+                _BASE_SHOT.model_copy(update={"to_station_name": "A 2"}),
+                ValueError,
+                id="to_station_space",
+            ),
+        ],
+    )
+    def test_invalid_station_name_raises(self, header_no_bs, shot, expected_exc):
         """Test that invalid station names raise error."""
-        header = CompassSurveyHeader(has_backsights=False)
-        shot = CompassShot(
-            from_station_name="A 1",  # Invalid: space
-            to_station_name="A2",
-            length=10.0,
-            frontsight_azimuth=45.0,
-            frontsight_inclination=-5.0,
-        )
-
-        with pytest.raises(ValueError, match="Invalid station name"):
-            format_shot(shot, header)
+        with pytest.raises(expected_exc, match="Invalid station name"):
+            format_shot(shot, header_no_bs)
 
 
 class TestFormatsurveyHeader:
     """Tests for format_survey_header function."""
 
+    _EXPECTED_BASIC = (
+        b"SECRET CAVE",
+        b"SURVEY NAME: A",
+        b"SURVEY DATE: 7 10 1979",
+        b"DECLINATION: 1.00",
+        b"FORMAT:",
+    )
+
     def test_basic_header(self):
         """Test formatting a basic header."""
-        header = CompassSurveyHeader(
-            cave_name="SECRET CAVE",
-            survey_name="A",
-            date=date(1979, 7, 10),
-            declination=1.0,
-            has_backsights=False,
-        )
-        result = format_survey_header(header)
+        result = format_survey_header(_BASE_HEADER_NO_BS).encode("ascii")
 
-        assert "SECRET CAVE" in result
-        assert "SURVEY NAME: A" in result
-        assert "SURVEY DATE: 7 10 1979" in result
-        assert "DECLINATION: 1.00" in result
-        assert "FORMAT:" in result
+        assert all(n in result for n in self._EXPECTED_BASIC)
 
     def test_header_with_team(self):
         """Test formatting header with team."""
-        header = CompassSurveyHeader(
-            cave_name="SECRET CAVE",
-            survey_name="A",
-            date=date(1979, 7, 10),
-            declination=1.0,
-            team="D.SMITH,R.BROWN",
-        )
-        result = format_survey_header(header)
+        header = _BASE_HEADER.model_copy(update={"team": "D.SMITH,R.BROWN"})
+        result = format_survey_header(header).encode("ascii")
 
-        assert "SURVEY TEAM:" in result
-        assert "D.SMITH,R.BROWN" in result
+        assert b"SURVEY TEAM:" in result
+        assert b"D.SMITH,R.BROWN" in result
 
     def test_header_with_comment(self):
         """Test formatting header with comment."""
-        header = CompassSurveyHeader(
-            cave_name="SECRET CAVE",
-            survey_name="A",
-            date=date(1979, 7, 10),
-            declination=1.0,
-            comment="Entrance Passage",
-        )
-        result = format_survey_header(header)
+        header = _BASE_HEADER.model_copy(update={"comment": "Entrance Passage"})
+        result = format_survey_header(header).encode("ascii")
 
-        assert "COMMENT:Entrance Passage" in result
+        assert b"COMMENT:Entrance Passage" in result
 
     def test_header_with_corrections(self):
         """Test formatting header with corrections."""
-        header = CompassSurveyHeader(
-            cave_name="SECRET CAVE",
-            survey_name="A",
-            date=date(1979, 7, 10),
-            declination=1.0,
-            length_correction=2.0,
-            frontsight_azimuth_correction=3.0,
-            frontsight_inclination_correction=4.0,
+        header = _BASE_HEADER.model_copy(
+            update={
+                "length_correction": 2.0,
+                "frontsight_azimuth_correction": 3.0,
+                "frontsight_inclination_correction": 4.0,
+            }
         )
-        result = format_survey_header(header)
+        result = format_survey_header(header).encode("ascii")
 
-        assert "CORRECTIONS:" in result
-        assert "2.00" in result
-        assert "3.00" in result
-        assert "4.00" in result
+        assert _HEADER_CORRECTIONS_RE.search(result)
 
     def test_header_without_column_headers(self):
         """Test formatting header without column headers."""
-        header = CompassSurveyHeader(
-            cave_name="SECRET CAVE",
-            survey_name="A",
-            date=date(1979, 7, 10),
-            declination=1.0,
-        )
-        result = format_survey_header(header, include_column_headers=False)
+        result = format_survey_header(
+            _BASE_HEADER, include_column_headers=False
+        ).encode("ascii")
 
-        assert "FROM" not in result
-        assert "LEN" not in result
+        assert b"FROM" not in result
+        assert b"LEN" not in result
 
 
 class TestFormatDatFile:
@@ -214,23 +176,7 @@ class TestFormatDatFile:
 
     def test_single_survey(self):
         """Test formatting a file with one survey."""
-        header = CompassSurveyHeader(
-            cave_name="SECRET CAVE",
-            survey_name="A",
-            date=date(1979, 7, 10),
-            declination=1.0,
-            has_backsights=False,
-        )
-        shots = [
-            CompassShot(
-                from_station_name="A1",
-                to_station_name="A2",
-                length=10.0,
-                frontsight_azimuth=45.0,
-                frontsight_inclination=-5.0,
-            ),
-        ]
-        survey = CompassSurvey(header=header, shots=shots)
+        survey = CompassSurvey(header=_BASE_HEADER_NO_BS, shots=[_BASE_SHOT])
 
         result = format_dat_file([survey])
 
@@ -243,23 +189,11 @@ class TestFormatDatFile:
         """Test formatting a file with multiple surveys."""
         surveys = []
         for name in ["A", "B"]:
-            header = CompassSurveyHeader(
-                cave_name="SECRET CAVE",
-                survey_name=name,
-                date=date(1979, 7, 10),
-                declination=1.0,
-                has_backsights=False,
+            header = _BASE_HEADER_NO_BS.model_copy(update={"survey_name": name})
+            shot = _BASE_SHOT.model_copy(
+                update={"from_station_name": f"{name}1", "to_station_name": f"{name}2"}
             )
-            shots = [
-                CompassShot(
-                    from_station_name=f"{name}1",
-                    to_station_name=f"{name}2",
-                    length=10.0,
-                    frontsight_azimuth=45.0,
-                    frontsight_inclination=-5.0,
-                ),
-            ]
-            surveys.append(CompassSurvey(header=header, shots=shots))
+            surveys.append(CompassSurvey(header=header, shots=[shot]))
 
         result = format_dat_file(surveys)
 
@@ -268,23 +202,7 @@ class TestFormatDatFile:
 
     def test_streaming_mode(self):
         """Test streaming mode with write callback."""
-        header = CompassSurveyHeader(
-            cave_name="SECRET CAVE",
-            survey_name="A",
-            date=date(1979, 7, 10),
-            declination=1.0,
-            has_backsights=False,
-        )
-        shots = [
-            CompassShot(
-                from_station_name="A1",
-                to_station_name="A2",
-                length=10.0,
-                frontsight_azimuth=45.0,
-                frontsight_inclination=-5.0,
-            ),
-        ]
-        survey = CompassSurvey(header=header, shots=shots)
+        survey = CompassSurvey(header=_BASE_HEADER_NO_BS, shots=[_BASE_SHOT])
 
         chunks: list[str] = []
         result = format_dat_file([survey], write=chunks.append)
@@ -297,47 +215,46 @@ class TestFormatDatFile:
 class TestFormatMakDirective:
     """Tests for format_directive function."""
 
-    def test_comment_directive(self):
-        """Test formatting comment directive."""
-        directive = CommentDirective(comment="This is a comment")
-        result = format_directive(directive)
-        assert result == "/This is a comment\r\n"
-
-    def test_datum_directive(self):
-        """Test formatting datum directive."""
-        directive = DatumDirective(datum="North American 1983")
-        result = format_directive(directive)
-        assert result == "&North American 1983;\r\n"
-
-    def test_utm_zone_directive(self):
-        """Test formatting UTM zone directive."""
-        directive = UTMZoneDirective(utm_zone=13)
-        result = format_directive(directive)
-        assert result == "$13;\r\n"
-
-    def test_utm_zone_directive_negative(self):
-        """Test formatting negative UTM zone directive (southern hemisphere)."""
-        directive = UTMZoneDirective(utm_zone=-13)
-        result = format_directive(directive)
-        assert result == "$-13;\r\n"
-
-    def test_utm_convergence_directive(self):
-        """Test formatting UTM convergence directive."""
-        directive = UTMConvergenceDirective(utm_convergence=-0.26)
-        result = format_directive(directive)
-        assert result == "%-0.260;\r\n"
-
-    def test_flags_directive(self):
-        """Test formatting flags directive."""
-        directive = FlagsDirective(flags=0)
-        result = format_directive(directive)
-        assert result == "!ot;\r\n"
-
-        directive = FlagsDirective(
-            flags=FlagsDirective.OVERRIDE_LRUDS | FlagsDirective.LRUDS_AT_TO_STATION
-        )
-        result = format_directive(directive)
-        assert result == "!OT;\r\n"
+    @pytest.mark.parametrize(
+        ("directive", "expected"),
+        [
+            pytest.param(
+                CommentDirective(comment="This is a comment"),
+                "/This is a comment\r\n",
+                id="comment",
+            ),
+            pytest.param(
+                DatumDirective(datum="North American 1983"),
+                "&North American 1983;\r\n",
+                id="datum",
+            ),
+            pytest.param(UTMZoneDirective(utm_zone=13), "$13;\r\n", id="utm_zone"),
+            # Negative zone: southern hemisphere
+            pytest.param(
+                UTMZoneDirective(utm_zone=-13), "$-13;\r\n", id="utm_zone_negative"
+            ),
+            pytest.param(
+                UTMConvergenceDirective(utm_convergence=-0.26),
+                "%-0.260;\r\n",
+                id="utm_convergence",
+            ),
+            pytest.param(FlagsDirective(flags=0), "!ot;\r\n", id="flags_off"),
+            pytest.param(
+                FlagsDirective(
+                    flags=FlagsDirective.OVERRIDE_LRUDS
+                    | FlagsDirective.LRUDS_AT_TO_STATION
+                ),
+                "!OT;\r\n",
+                id="flags_on",
+            ),
+            pytest.param(
+                FileDirective(file="ENTRANCE.DAT"), "#ENTRANCE.DAT;\r\n", id="file"
+            ),
+        ],
+    )
+    def test_format_directive(self, directive, expected):
+        """Test formatting a single directive."""
+        assert format_directive(directive) == expected
 
     def test_location_directive(self):
         """Test formatting location directive."""
@@ -353,12 +270,6 @@ class TestFormatMakDirective:
         assert result.endswith(";\r\n")
         assert "546866.900" in result
 
-    def test_file_directive_simple(self):
-        """Test formatting simple file directive."""
-        directive = FileDirective(file="ENTRANCE.DAT")
-        result = format_directive(directive)
-        assert result == "#ENTRANCE.DAT;\r\n"
-
 
 class TestFormatMakFile:
     """Tests for format_mak_file function."""
@@ -374,6 +285,4 @@ class TestFormatMakFile:
         result = format_mak_file(directives)
 
         assert result is not None
-        assert "&North American 1983;" in result
-        assert "$13;" in result
-        assert "#ENTRANCE.DAT;" in result
+        assert _MAK_DIRECTIVES_RE.search(result)
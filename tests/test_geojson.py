@@ -4,10 +4,12 @@
 All test files are sourced from tests/artifacts/private/.
 """
 
-import json
 import logging
-from pathlib import Path
+from collections.abc import Sequence
+from types import SimpleNamespace
 
+import numpy as np
+import orjson
 import pytest
 
 from compass_lib import load_project
@@ -20,18 +22,49 @@ from compass_lib.geojson import survey_to_geojson
 # Import fixtures from conftest
 from tests.conftest import ALL_MAK_FILES
 from tests.conftest import FIRST_MAK
+from tests.conftest import PRIVATE_DATA_DIR
+from tests.conftest import get_geojson
+from tests.conftest import split_features
 
 logger = logging.getLogger(__name__)
 
+# Artifact availability, checked once at import rather than per test.
+requires_first_mak = pytest.mark.skipif(FIRST_MAK is None, reason="No test file")
+_PROJECT022 = PRIVATE_DATA_DIR / "project022.mak"
+
+
+def _assert_allclose(
+    actual: np.ndarray,
+    expected: np.ndarray,
+    labels: Sequence[str],
+    atol: float,
+    what: str,
+) -> None:
+    """Assert `actual` matches `expected` within `atol`, naming the first mismatch."""
+    mismatched = np.flatnonzero(~np.isclose(actual, expected, rtol=0, atol=atol))
+    if mismatched.size:
+        idx = mismatched[0]
+        pytest.fail(
+            f"{what}: feature {labels[idx]!r} has {actual[idx]}, expected "
+            f"{expected[idx]} ({mismatched.size} of {actual.size} mismatched)"
+        )
+
+
+def _assert_3d(dims: np.ndarray, what: str) -> None:
+    """Assert every coordinate tuple length in `dims` is 3, naming the first miss."""
+    # One vectorized comparison; the message is only built on failure.
+    bad = np.flatnonzero(dims != 3)
+    if bad.size:
+        pytest.fail(f"{what}: coord[{bad[0]}] has {dims[bad[0]]} dimensions")
+
 
 class TestComputeSurveyCoordinates:
     """Tests for compute_survey_coordinates function."""
 
     @pytest.mark.parametrize("mak_path", ALL_MAK_FILES)
-    def test_compute_survey_coordinates(self, mak_path):
+    def test_compute_survey_coordinates(self, computed_survey):
         """Test computing coordinates for survey."""
-        project = load_project(mak_path)
-        survey = compute_survey_coordinates(project)
+        survey = computed_survey
 
         # Should have stations (may be 0 for some edge-case files)
         assert len(survey.stations) >= 0
@@ -40,10 +73,9 @@ class TestComputeSurveyCoordinates:
         assert len(survey.legs) >= 0
 
     @pytest.mark.parametrize("mak_path", ALL_MAK_FILES)
-    def test_compute_with_valid_utm_zone(self, mak_path):
+    def test_compute_with_valid_utm_zone(self, computed_survey):
         """Test that UTM zone is valid."""
-        project = load_project(mak_path)
-        survey = compute_survey_coordinates(project)
+        survey = computed_survey
 
         # Should have a valid UTM zone (1-60 for north, -1 to -60 for south)
         assert survey.utm_zone is not None
@@ -54,41 +86,30 @@ class TestComputeSurveyCoordinates:
 class TestSurveyToGeoJSON:
     """Tests for survey_to_geojson function."""
 
-    @pytest.mark.skipif(
-        FIRST_MAK is None or not FIRST_MAK.exists(), reason="No test file"
-    )
-    def test_geojson_structure(self):
+    def test_geojson_structure(self, first_survey):
         """Test that GeoJSON has correct structure."""
-        project = load_project(FIRST_MAK)
-        survey = compute_survey_coordinates(project)
-        geojson = survey_to_geojson(survey)
+        geojson = survey_to_geojson(first_survey)
 
         assert geojson["type"] == "FeatureCollection"
         assert "features" in geojson
         assert isinstance(geojson["features"], list)
 
-    @pytest.mark.skipif(
-        FIRST_MAK is None or not FIRST_MAK.exists(), reason="No test file"
-    )
-    def test_geojson_with_stations_only(self):
+    def test_geojson_with_stations_only(self, first_survey):
         """Test that stations can be included exclusively."""
-        project = load_project(FIRST_MAK)
-        survey = compute_survey_coordinates(project)
-        geojson = survey_to_geojson(survey, include_stations=True, include_legs=False)
+        geojson = survey_to_geojson(
+            first_survey, include_stations=True, include_legs=False
+        )
 
         # All features should be stations
         for feature in geojson["features"]:
             assert feature["geometry"]["type"] == "Point"
             assert feature["properties"]["type"] == "station"
 
-    @pytest.mark.skipif(
-        FIRST_MAK is None or not FIRST_MAK.exists(), reason="No test file"
-    )
-    def test_geojson_with_legs_only(self):
+    def test_geojson_with_legs_only(self, first_survey):
         """Test that legs can be included exclusively."""
-        project = load_project(FIRST_MAK)
-        survey = compute_survey_coordinates(project)
-        geojson = survey_to_geojson(survey, include_stations=False, include_legs=True)
+        geojson = survey_to_geojson(
+            first_survey, include_stations=False, include_legs=True
+        )
 
         # All features should be legs or misclosure indicators
         for feature in geojson["features"]:
@@ -97,63 +118,40 @@ class TestSurveyToGeoJSON:
             is_misclosure = props.get("type") in ("misclosure", "misclosure_station")
             assert is_leg or is_misclosure
 
-    @pytest.mark.skipif(
-        FIRST_MAK is None or not FIRST_MAK.exists(), reason="No test file"
-    )
-    def test_geojson_without_stations(self):
+    def test_geojson_without_stations(self, first_survey):
         """Test that stations can be excluded."""
-        project = load_project(FIRST_MAK)
-        survey = compute_survey_coordinates(project)
-        geojson = survey_to_geojson(survey, include_stations=False)
+        geojson = survey_to_geojson(first_survey, include_stations=False)
 
         # No point features
         for feature in geojson["features"]:
             assert feature["geometry"]["type"] != "Point"
 
-    @pytest.mark.skipif(
-        FIRST_MAK is None or not FIRST_MAK.exists(), reason="No test file"
-    )
-    def test_geojson_without_legs(self):
+    def test_geojson_without_legs(self, first_survey):
         """Test that legs can be excluded."""
-        project = load_project(FIRST_MAK)
-        survey = compute_survey_coordinates(project)
-        geojson = survey_to_geojson(survey, include_legs=False)
+        geojson = survey_to_geojson(first_survey, include_legs=False)
 
         # No linestring features
         for feature in geojson["features"]:
             assert feature["geometry"]["type"] != "LineString"
 
-    @pytest.mark.skipif(
-        FIRST_MAK is None or not FIRST_MAK.exists(), reason="No test file"
-    )
-    def test_geojson_with_passages(self):
+    def test_geojson_with_passages(self, first_survey, first_full_features):
         """Test that passages can be included."""
-        project = load_project(FIRST_MAK)
-        survey = compute_survey_coordinates(project)
         geojson = survey_to_geojson(
-            survey,
+            first_survey,
             include_stations=False,
             include_legs=False,
             include_passages=True,
         )
 
-        # Should have polygon features (from legs with LRUD data)
-        # Note: may have zero if no LRUD data
-        if geojson["features"]:
-            polygon_count = sum(
-                1 for f in geojson["features"] if f["geometry"]["type"] == "Polygon"
-            )
-            # Just verify no error occurred
-            assert isinstance(polygon_count, int)
+        # Polygon features come from legs with LRUD data (may be zero without
+        # it) and must not depend on which other feature kinds are exported.
+        passages = split_features(geojson)
+        assert not passages.stations
+        assert len(passages.polygons) == len(first_full_features.polygons)
 
-    @pytest.mark.skipif(
-        FIRST_MAK is None or not FIRST_MAK.exists(), reason="No test file"
-    )
-    def test_geojson_properties(self):
+    def test_geojson_properties(self, first_survey):
         """Test that metadata is included in properties."""
-        project = load_project(FIRST_MAK)
-        survey = compute_survey_coordinates(project)
-        geojson = survey_to_geojson(survey)
+        geojson = survey_to_geojson(first_survey)
 
         # Metadata should be in properties
         assert "properties" in geojson
@@ -165,10 +163,9 @@ class TestProjectToGeoJSON:
     """Tests for project_to_geojson function."""
 
     @pytest.mark.parametrize("mak_path", ALL_MAK_FILES)
-    def test_project_to_geojson(self, mak_path):
+    def test_project_to_geojson(self, loaded_project):
         """Test high-level project_to_geojson function."""
-        project = load_project(mak_path)
-        geojson = project_to_geojson(project)
+        geojson = project_to_geojson(loaded_project)
 
         assert geojson["type"] == "FeatureCollection"
         assert len(geojson["features"]) > 0
@@ -182,77 +179,69 @@ class TestConvertMakToGeoJSON:
     """Tests for convert_mak_to_geojson function."""
 
     @pytest.mark.parametrize("mak_path", ALL_MAK_FILES)
-    def test_convert_to_valid_geojson(self, mak_path):
-        """Test conversion produces valid GeoJSON with valid WGS84 coordinates."""
-        result = convert_mak_to_geojson(mak_path)
+    def test_convert_to_valid_geojson(self, mak_path, project_features):
+        """Test conversion produces valid WGS84 coordinates."""
+        # Checked on the cached dict: serializing each project only to parse
+        # it back is covered once by test_convert_to_valid_geojson_roundtrip.
+        assert project_features.full["type"] == "FeatureCollection"
+
+        # Check that stations have valid WGS84 coordinates
+        coords = project_features.station_coords
+        assert len(coords) > 0, f"No stations in {mak_path.name}"
+
+        lons, lats = coords[:, 0], coords[:, 1]
+        # WGS84 longitude should be between -180 and 180, latitude -90 to 90
+        # (written as "not in range" so NaN coordinates are reported too)
+        invalid = np.flatnonzero(
+            ~((lons >= -180) & (lons <= 180) & (lats >= -90) & (lats <= 90))
+        )
+        if invalid.size:
+            idx = invalid[0]
+            name = project_features.stations[idx]["properties"]["name"]
+            pytest.fail(
+                f"Invalid WGS84 coordinate ({lons[idx]}, {lats[idx]}) for station "
+                f"'{name}' in {mak_path.name}"
+            )
+
+    @pytest.mark.slow
+    @requires_first_mak
+    def test_convert_to_valid_geojson_roundtrip(self):
+        """Test conversion to a string produces parseable GeoJSON."""
+        result = convert_mak_to_geojson(FIRST_MAK)
 
         # Should be valid JSON
-        parsed = json.loads(result)
+        parsed = orjson.loads(result)
         assert parsed["type"] == "FeatureCollection"
+        assert len(parsed["features"]) == len(get_geojson(FIRST_MAK)["features"])
 
-        # Check that stations have valid WGS84 coordinates
-        stations = [
-            f for f in parsed["features"] if f["properties"].get("type") == "station"
-        ]
-        assert len(stations) > 0, f"No stations in {mak_path.name}"
-
-        for station in stations:
-            coords = station["geometry"]["coordinates"]
-            lon, lat = coords[0], coords[1]
-            # WGS84 longitude should be between -180 and 180
-            assert -180 <= lon <= 180, f"Invalid longitude: {lon} in {mak_path.name}"
-            # WGS84 latitude should be between -90 and 90
-            assert -90 <= lat <= 90, f"Invalid latitude: {lat} in {mak_path.name}"
-
-    @pytest.mark.skipif(
-        FIRST_MAK is None or not FIRST_MAK.exists(), reason="No test file"
-    )
-    def test_convert_to_file(self, tmp_path):
+    @pytest.mark.slow
+    @requires_first_mak
+    def test_convert_to_file(self, shared_tmp_path):
         """Test conversion writes to file."""
-        output_path = tmp_path / "output.geojson"
+        output_path = shared_tmp_path / f"{FIRST_MAK.stem}.geojson"
 
         convert_mak_to_geojson(FIRST_MAK, output_path)
 
         assert output_path.exists()
-        with output_path.open(mode="r", encoding="utf-8") as f:
-            parsed = json.load(f)
+        parsed = orjson.loads(output_path.read_bytes())
         assert parsed["type"] == "FeatureCollection"
+        assert len(parsed["features"]) == len(get_geojson(FIRST_MAK)["features"])
 
 
 class TestGeoJSONFeatureProperties:
     """Tests for feature properties in GeoJSON output."""
 
-    @pytest.mark.skipif(
-        FIRST_MAK is None or not FIRST_MAK.exists(), reason="No test file"
-    )
-    def test_station_properties(self):
+    def test_station_properties(self, first_features):
         """Test that station features have correct properties."""
-        project = load_project(FIRST_MAK)
-        geojson = project_to_geojson(project)
-
-        stations = [
-            f for f in geojson["features"] if f["properties"].get("type") == "station"
-        ]
-
-        for station in stations:
+        for station in first_features.stations:
             props = station["properties"]
             assert "name" in props
             assert "file" in props
             assert "elevation_m" in props
 
-    @pytest.mark.skipif(
-        FIRST_MAK is None or not FIRST_MAK.exists(), reason="No test file"
-    )
-    def test_leg_properties(self):
+    def test_leg_properties(self, first_features):
         """Test that leg features have correct properties."""
-        project = load_project(FIRST_MAK)
-        geojson = project_to_geojson(project)
-
-        legs = [
-            f
-            for f in geojson["features"]
-            if f["geometry"]["type"] == "LineString" and "id" in f["properties"]
-        ]
+        legs = first_features.legs
 
         assert len(legs) > 0, "Should have at least one leg"
         for leg in legs:
@@ -264,135 +253,97 @@ class TestGeoJSONFeatureProperties:
             assert isinstance(props["depth"], (int, float))
             assert isinstance(props["name"], str)
 
-    @pytest.mark.skipif(
-        FIRST_MAK is None or not FIRST_MAK.exists(), reason="No test file"
-    )
-    def test_coordinate_dimensions(self):
+    def test_coordinate_dimensions(self, first_features):
         """Test that station coordinates are 3D and leg coordinates are 2D."""
-        project = load_project(FIRST_MAK)
-        geojson = project_to_geojson(project)
+        _assert_3d(first_features.point_dims, "Point should have 3D coordinates")
+        _assert_3d(first_features.leg_dims, "Leg coords should be 3D")
 
-        for feature in geojson["features"]:
-            geom_type = feature["geometry"]["type"]
-            props = feature["properties"]
-            if geom_type == "Point":
-                coords = feature["geometry"]["coordinates"]
-                assert len(coords) == 3, "Point should have 3D coordinates"
-            elif geom_type == "LineString" and "id" in props:
-                for coord in feature["geometry"]["coordinates"]:
-                    assert len(coord) == 3, "Leg coords should be 3D"
-
-    @pytest.mark.skipif(
-        FIRST_MAK is None or not FIRST_MAK.exists(), reason="No test file"
-    )
-    def test_depth_property_is_positive_feet(self):
+    def test_depth_property_is_positive_feet(self, first_full_features):
         """Every feature with a 'depth' property must have a non-negative value."""
-        project = load_project(FIRST_MAK)
-        geojson = project_to_geojson(project, include_anchors=True)
-
-        features_with_depth = [
-            f for f in geojson["features"] if "depth" in f["properties"]
-        ]
-        assert len(features_with_depth) > 0, "Expected features with depth property"
-
-        for feat in features_with_depth:
-            depth = feat["properties"]["depth"]
-            assert isinstance(depth, (int, float)), f"depth must be numeric, got {type(depth)}"
-            assert depth >= 0, (
-                f"depth must be >= 0 (positive feet), got {depth} "
-                f"on feature {feat['properties'].get('id', feat['properties'].get('name'))}"
-            )
+        depths = first_full_features.depths
+
+        assert depths.size > 0, "Expected features with depth property"
+        assert depths.dtype.kind in "iuf", f"depth must be numeric, got {depths.dtype}"
+        negative = np.flatnonzero(depths < 0)
+        assert negative.size == 0, (
+            f"depth must be >= 0 (positive feet), got {depths[negative[0]]} "
+            f"on feature {first_full_features.depth_ids[negative[0]]}"
+        )
 
-    @pytest.mark.skipif(
-        FIRST_MAK is None or not FIRST_MAK.exists(), reason="No test file"
-    )
-    def test_elevation_coordinate_matches_property(self):
+    def test_elevation_coordinate_matches_property(self, first_features):
         """Station Point elevation coordinate must equal the elevation_m property."""
-        project = load_project(FIRST_MAK)
-        geojson = project_to_geojson(project)
-
-        stations = [
-            f for f in geojson["features"] if f["properties"].get("type") == "station"
-        ]
-        assert len(stations) > 0
-
-        for station in stations:
-            coords = station["geometry"]["coordinates"]
-            elevation_coord = coords[2]
-            elevation_prop = station["properties"]["elevation_m"]
-            assert elevation_coord == pytest.approx(elevation_prop, abs=0.01), (
-                f"Station '{station['properties']['name']}': coordinate elevation "
-                f"({elevation_coord}) != elevation_m property ({elevation_prop})"
-            )
+        assert len(first_features.station_names) > 0
+        _assert_allclose(
+            first_features.station_coords[:, 2],
+            first_features.station_elevation_m,
+            first_features.station_names,
+            atol=0.01,
+            what="Station coordinate elevation != elevation_m property",
+        )
 
-    @pytest.mark.skipif(
-        FIRST_MAK is None or not FIRST_MAK.exists(), reason="No test file"
-    )
-    def test_depth_consistent_with_elevation(self):
+    def test_depth_consistent_with_elevation(self, first_full_features):
         """The depth property (positive feet) must equal abs(elevation_m * METERS_TO_FEET)."""
-        project = load_project(FIRST_MAK)
-        geojson = project_to_geojson(project, include_anchors=True)
-
-        for feat in geojson["features"]:
-            props = feat["properties"]
-            if "depth" not in props:
-                continue
-
-            geom = feat["geometry"]
-            if geom["type"] == "Point":
-                elev_m = geom["coordinates"][2]
-            elif geom["type"] == "LineString":
-                elev_m = geom["coordinates"][-1][2]
-            else:
-                continue
-
-            expected_depth = abs(round(elev_m * METERS_TO_FEET, 2))
-            assert props["depth"] == pytest.approx(expected_depth, abs=0.1), (
-                f"Feature {props.get('id', props.get('name'))}: "
-                f"depth={props['depth']} != abs(round({elev_m} * METERS_TO_FEET, 2))={expected_depth}"
-            )
+        features = first_full_features
+        expected_depth = np.abs(np.round(features.depth_elev * METERS_TO_FEET, 2))
+        _assert_allclose(
+            features.depths,
+            expected_depth,
+            features.depth_ids,
+            atol=0.1,
+            what="depth != abs(round(elevation_m * METERS_TO_FEET, 2))",
+        )
 
 
+@pytest.fixture(scope="module")
+def project022_run() -> SimpleNamespace:
+    """Run the project022 pipeline once, capturing its warnings.
+
+    ``caplog`` is function-scoped, so the records are collected by a
+    plain handler on the package logger for the duration of the run.
+    """
+    records: list[logging.LogRecord] = []
+    handler = logging.Handler(level=logging.WARNING)
+    handler.emit = records.append
+    package_logger = logging.getLogger("compass_lib")
+    previous_level = package_logger.level
+    package_logger.addHandler(handler)
+    if package_logger.getEffectiveLevel() > logging.WARNING:
+        package_logger.setLevel(logging.WARNING)
+    try:
+        survey = compute_survey_coordinates(load_project(_PROJECT022))
+    finally:
+        package_logger.removeHandler(handler)
+        package_logger.setLevel(previous_level)
+
+    return SimpleNamespace(
+        survey=survey,
+        warnings="\n".join(record.getMessage() for record in records),
+    )
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(
+    not _PROJECT022.exists(), reason="project022 test files not available"
+)
 class TestAnchorValidation:
     """Tests for disconnected anchor detection and orphan warnings."""
 
-    PROJECT022 = Path("tests/artifacts/private/project022.mak")
-
-    @pytest.mark.skipif(
-        not Path("tests/artifacts/private/project022.mak").exists(),
-        reason="project022 test files not available",
-    )
-    def test_disconnected_anchor_excluded_from_stations(self):
+    def test_disconnected_anchor_excluded_from_stations(self, project022_run):
         """Anchor 'lc0' in project022 has no shots -- it must be excluded."""
-        project = load_project(self.PROJECT022)
-        survey = compute_survey_coordinates(project)
+        survey = project022_run.survey
 
         # lc0 should NOT be in the computed stations (it is disconnected)
         assert "lc0" not in survey.stations
         assert "lc0" not in survey.anchors
 
-    @pytest.mark.skipif(
-        not Path("tests/artifacts/private/project022.mak").exists(),
-        reason="project022 test files not available",
-    )
-    def test_disconnected_anchor_logged_as_warning(self, caplog):
+    def test_disconnected_anchor_logged_as_warning(self, project022_run):
         """A disconnected anchor must produce a warning."""
+        # Should warn about lc0 (DEBUG/INFO noise from other modules ignored)
+        assert "lc0" in project022_run.warnings
 
-        with caplog.at_level(logging.WARNING):
-            project = load_project(self.PROJECT022)
-            compute_survey_coordinates(project)
-
-        # Should warn about lc0
-        assert any("lc0" in record.message for record in caplog.records)
-
-    @pytest.mark.skipif(
-        not Path("tests/artifacts/private/project022.mak").exists(),
-        reason="project022 test files not available",
-    )
-    def test_connected_anchors_still_present(self):
+    def test_connected_anchors_still_present(self, project022_run):
         """Anchors that DO appear in shots must remain."""
-        project = load_project(self.PROJECT022)
-        survey = compute_survey_coordinates(project)
+        survey = project022_run.survey
 
         # These anchors exist in project022-1.dat shots
         for name in ("FF_Up0", "FF_A27", "U0", "c1", "FF_F22", "d20"):
@@ -404,51 +355,25 @@ class TestPrivateProjectsGeoJSON:
     """Tests specifically for private project GeoJSON conversion."""
 
     @pytest.mark.parametrize("mak_path", ALL_MAK_FILES)
-    def test_project_geojson_has_stations(self, mak_path):
+    def test_project_geojson_has_stations(self, mak_path, project_features):
         """Test that projects produce GeoJSON with stations."""
-        project = load_project(mak_path)
-        geojson = project_to_geojson(project)
-
-        stations = [
-            f for f in geojson["features"] if f["properties"].get("type") == "station"
-        ]
-
         # Should have at least some stations
-        assert len(stations) > 0, f"No stations in {mak_path.name}"
+        assert len(project_features.stations) > 0, f"No stations in {mak_path.name}"
 
     @pytest.mark.parametrize("mak_path", ALL_MAK_FILES)
-    def test_project_has_valid_utm_zone(self, mak_path):
-        """Test that projects have valid UTM zones."""
-        project = load_project(mak_path)
-        survey = compute_survey_coordinates(project)
+    def test_project_has_valid_utm_zone(self, project_features):
+        """Test that project GeoJSON records a valid source UTM zone."""
+        # The survey-level invariant is covered by
+        # TestComputeSurveyCoordinates.test_compute_with_valid_utm_zone; this
+        # checks it survives into the exported metadata (omitted when unset).
+        utm_zone = project_features.full["properties"].get("source_utm_zone")
 
         # Should have a valid UTM zone (1-60 for north, -1 to -60 for south)
-        assert survey.utm_zone is not None
-        assert survey.utm_zone != 0, "UTM zone cannot be 0"
-        assert abs(survey.utm_zone) <= 60, f"Invalid UTM zone: {survey.utm_zone}"
+        assert utm_zone is not None
+        assert utm_zone != 0, "UTM zone cannot be 0"
+        assert abs(utm_zone) <= 60, f"Invalid UTM zone: {utm_zone}"
 
     @pytest.mark.parametrize("mak_path", ALL_MAK_FILES)
-    def test_all_coordinates_are_3d(self, mak_path):
+    def test_all_coordinates_are_3d(self, mak_path, project_full_features):
         """Every coordinate tuple (Point, LineString, Polygon) must have 3 elements."""
-        project = load_project(mak_path)
-        geojson = project_to_geojson(project, include_passages=True, include_anchors=True)
-
-        for feat in geojson["features"]:
-            geom = feat["geometry"]
-            geom_type = geom["type"]
-
-            if geom_type == "Point":
-                assert len(geom["coordinates"]) == 3, (
-                    f"Point coords should be 3D in {mak_path.name}"
-                )
-            elif geom_type == "LineString":
-                for i, coord in enumerate(geom["coordinates"]):
-                    assert len(coord) == 3, (
-                        f"LineString coord[{i}] should be 3D in {mak_path.name}"
-                    )
-            elif geom_type == "Polygon":
-                for ring in geom["coordinates"]:
-                    for i, coord in enumerate(ring):
-                        assert len(coord) == 3, (
-                            f"Polygon coord[{i}] should be 3D in {mak_path.name}"
-                        )
+        _assert_3d(project_full_features.coord_dims, mak_path.name)
@@ -20,21 +20,25 @@ from tests.conftest import ALL_MAK_FILES
 from tests.conftest import ARTIFACTS_DIR
 
 
+@pytest.fixture(scope="module")
+def simple_project() -> CompassMakFile:
+    """Load ``simple.mak`` once for the read-only tests in this module."""
+    return load_project(ARTIFACTS_DIR / "simple.mak")
+
+
 class TestLoadProject:
     """Tests for load_project function."""
 
-    def test_load_simple_mak(self):
+    def test_load_simple_mak(self, simple_project):
         """Test loading a simple MAK file."""
-        mak_path = ARTIFACTS_DIR / "simple.mak"
-        project = load_project(mak_path)
+        project = simple_project
 
         assert isinstance(project, CompassMakFile)
         assert len(project.directives) > 0
 
-    def test_load_project_file_directives(self):
+    def test_load_project_file_directives(self, simple_project):
         """Test that file directives are populated."""
-        mak_path = ARTIFACTS_DIR / "simple.mak"
-        project = load_project(mak_path)
+        project = simple_project
 
         # Should have at least one file directive
         file_directives = project.file_directives
@@ -46,10 +50,9 @@ class TestLoadProject:
             assert fd.file is not None
             assert len(fd.file) > 0
 
-    def test_load_project_with_dat_data(self):
+    def test_load_project_with_dat_data(self, simple_project):
         """Test that DAT file data is loaded into directives."""
-        mak_path = ARTIFACTS_DIR / "simple.mak"
-        project = load_project(mak_path)
+        project = simple_project
 
         # Find file directives with data
         loaded_files = [fd for fd in project.file_directives if fd.data is not None]
@@ -63,10 +66,9 @@ class TestLoadProject:
             assert hasattr(fd.data, "surveys")
             assert len(fd.data.surveys) >= 1
 
-    def test_load_project_nested_surveys(self):
+    def test_load_project_nested_surveys(self, simple_project):
         """Test accessing surveys through the nested structure."""
-        mak_path = ARTIFACTS_DIR / "simple.mak"
-        project = load_project(mak_path)
+        project = simple_project
 
         total_surveys = 0
         total_shots = 0
@@ -98,10 +100,9 @@ class TestLoadProject:
                 assert ls.name is not None
                 assert len(ls.name) > 0
 
-    def test_load_project_location_property(self):
+    def test_load_project_location_property(self, simple_project):
         """Test accessing the project location."""
-        mak_path = ARTIFACTS_DIR / "simple.mak"
-        project = load_project(mak_path)
+        project = simple_project
 
         loc = project.location
         if loc:
@@ -110,47 +111,42 @@ class TestLoadProject:
             assert loc.northing is not None
             assert loc.utm_zone >= 1
 
-    def test_load_project_datum_property(self):
+    def test_load_project_datum_property(self, simple_project):
         """Test accessing the project datum."""
-        mak_path = ARTIFACTS_DIR / "simple.mak"
-        project = load_project(mak_path)
+        project = simple_project
 
         datum = project.datum
         if datum:
             assert isinstance(datum, str)
             assert len(datum) > 0
 
-    def test_project_total_surveys(self):
+    def test_project_total_surveys(self, simple_project):
         """Test the total_surveys property."""
-        mak_path = ARTIFACTS_DIR / "simple.mak"
-        project = load_project(mak_path)
+        project = simple_project
 
         total = project.total_surveys
         assert isinstance(total, int)
         assert total >= 1
 
-    def test_project_total_shots(self):
+    def test_project_total_shots(self, simple_project):
         """Test the total_shots property."""
-        mak_path = ARTIFACTS_DIR / "simple.mak"
-        project = load_project(mak_path)
+        project = simple_project
 
         total = project.total_shots
         assert isinstance(total, int)
         assert total >= 1
 
-    def test_project_get_all_stations(self):
+    def test_project_get_all_stations(self, simple_project):
         """Test getting all station names."""
-        mak_path = ARTIFACTS_DIR / "simple.mak"
-        project = load_project(mak_path)
+        project = simple_project
 
         stations = project.get_all_stations()
         assert isinstance(stations, set)
         assert len(stations) >= 1
 
-    def test_project_iter_files(self):
+    def test_project_iter_files(self, simple_project):
         """Test iterating over file directives."""
-        mak_path = ARTIFACTS_DIR / "simple.mak"
-        project = load_project(mak_path)
+        project = simple_project
 
         file_count = 0
         for fd in project.iter_files():
@@ -163,10 +159,9 @@ class TestLoadProject:
 class TestCompassDatFile:
     """Tests for CompassDatFile model."""
 
-    def test_dat_file_properties(self):
+    def test_dat_file_properties(self, simple_project):
         """Test CompassDatFile helper properties."""
-        mak_path = ARTIFACTS_DIR / "simple.mak"
-        project = load_project(mak_path)
+        project = simple_project
 
         for fd in project.file_directives:
             if fd.data:
@@ -202,17 +197,15 @@ class TestPrivateProjects:
     """Tests using the private project data."""
 
     @pytest.mark.parametrize("mak_path", ALL_MAK_FILES)
-    def test_load_project(self, mak_path):
+    def test_load_project(self, mak_path, loaded_project):
         """Test loading the project."""
-        project = load_project(mak_path)
-
-        assert isinstance(project, CompassMakFile)
-        assert len(project.file_directives) >= 1
+        assert isinstance(loaded_project, CompassMakFile)
+        assert len(loaded_project.file_directives) >= 1
 
     @pytest.mark.parametrize("mak_path", ALL_MAK_FILES)
-    def test_nested_data(self, mak_path):
+    def test_nested_data(self, mak_path, loaded_project):
         """Test accessing nested data in project."""
-        project = load_project(mak_path)
+        project = loaded_project
 
         # Check that DAT files are loaded (at least one should have data)
         loaded_count = sum(1 for fd in project.file_directives if fd.data)
@@ -225,13 +218,11 @@ class TestPrivateProjects:
         assert project.total_shots >= 0
 
     @pytest.mark.parametrize("mak_path", ALL_MAK_FILES)
-    def test_stations(self, mak_path):
+    def test_stations(self, mak_path, project_stations):
         """Test getting stations from project."""
-        project = load_project(mak_path)
-
-        stations = project.get_all_stations()
         # Some projects may have 0 or 1 station, just ensure no errors
-        assert isinstance(stations, set)
+        assert isinstance(project_stations, frozenset)
+        assert all(isinstance(name, str) for name in project_stations)
 
 
 class TestSaveProject:
@@ -247,14 +238,16 @@ class TestSaveProject:
         new_mak_path = tmp_path / "saved.mak"
         save_project(new_mak_path, project, save_dat_files=True)
 
+        # One directory listing instead of a stat() per file
+        present = {p.name for p in tmp_path.iterdir()}
+
         # MAK file should exist
-        assert new_mak_path.exists()
+        assert new_mak_path.name in present
 
         # DAT files should exist
         for fd in project.file_directives:
             if fd.data:
-                dat_path = tmp_path / fd.file
-                assert dat_path.exists(), f"DAT file {fd.file} should exist"
+                assert fd.file in present, f"DAT file {fd.file} should exist"
 
     def test_save_project_mak_only(self, tmp_path):
         """Test saving only the MAK file."""
@@ -266,11 +259,12 @@ class TestSaveProject:
         new_mak_path = tmp_path / "saved.mak"
         save_project(new_mak_path, project, save_dat_files=False)
 
+        present = {p.name for p in tmp_path.iterdir()}
+
         # MAK file should exist
-        assert new_mak_path.exists()
+        assert new_mak_path.name in present
 
         # DAT files should NOT exist in the new location
         for fd in project.file_directives:
             if fd.data:
-                dat_path = tmp_path / fd.file
-                assert not dat_path.exists(), f"DAT file {fd.file} should not exist"
+                assert fd.file not in present, f"DAT file {fd.file} should not exist"
@@ -1,6 +1,9 @@
 # -*- coding: utf-8 -*-
 """Tests for core models module."""
 
+import math
+import re
+
 import pytest
 
 from compass_lib.enums import Datum
@@ -9,21 +12,53 @@ from compass_lib.models import Location
 from compass_lib.models import NEVLocation
 from compass_lib.models import UTMLocation
 
+# Expected ``str()`` fields, matched in a single pass over the model repr.
+_NEV_STR_RE = re.compile(
+    r"easting=100\.0.*northing=200\.0.*elevation=300\.0", re.DOTALL
+)
+_LOC_STR_RE = re.compile(r"northing=100\.0.*easting=200\.0.*vertical=300\.0", re.DOTALL)
+
+# Expected validation error fragments, compiled once for ``pytest.raises``.
+_RE_UNIT = re.compile("unit")
+_RE_EASTING = re.compile("easting")
+_RE_ZONE = re.compile("zone")
+_RE_ZONE_ZERO = re.compile("cannot be 0")
+
+# Every datum plus "unset", frozen once instead of re-iterating the enum.
+_DATUMS_PLUS_NONE = (None, *Datum)
+
+
+def _datum_id(datum):
+    return getattr(datum, "name", "None")
+
+
+@pytest.fixture(scope="module")
+def nev_loc_fpm():
+    """NEVLocation in feet, shared by the read-only NEVLocation tests."""
+    return NEVLocation(easting=100.0, northing=200.0, elevation=300.0, unit="f")
+
+
+@pytest.fixture(scope="module")
+def location_full():
+    """Location with all three components set."""
+    return Location(northing=100.0, easting=200.0, vertical=300.0)
+
+
+@pytest.fixture(scope="module")
+def bounds_default():
+    """Bounds built with default lower/upper locations."""
+    return Bounds()
+
 
 class TestNEVLocation:
     """Tests for NEVLocation model."""
 
-    def test_creation(self):
+    def test_creation(self, nev_loc_fpm):
         """Test creating a NEV location."""
-        loc = NEVLocation(
-            easting=100.5,
-            northing=200.5,
-            elevation=300.5,
-            unit="f",
-        )
-        assert loc.easting == 100.5
-        assert loc.northing == 200.5
-        assert loc.elevation == 300.5
+        loc = nev_loc_fpm
+        assert loc.easting == 100.0
+        assert loc.northing == 200.0
+        assert loc.elevation == 300.0
         assert loc.unit == "f"
 
     def test_default_unit(self):
@@ -47,7 +82,7 @@ class TestNEVLocation:
 
     def test_invalid_unit(self):
         """Test that invalid unit raises ValueError."""
-        with pytest.raises(ValueError, match="unit"):
+        with pytest.raises(ValueError, match=_RE_UNIT):
             NEVLocation(
                 easting=100.0,
                 northing=200.0,
@@ -55,30 +90,17 @@ class TestNEVLocation:
                 unit="x",
             )
 
-    def test_str(self):
+    def test_str(self, nev_loc_fpm):
         """Test string representation."""
-        loc = NEVLocation(
-            easting=100.0,
-            northing=200.0,
-            elevation=300.0,
-            unit="f",
-        )
-        result = str(loc)
-        assert "easting=100.0" in result
-        assert "northing=200.0" in result
-        assert "elevation=300.0" in result
+        assert _NEV_STR_RE.search(str(nev_loc_fpm))
 
 
 class TestLocation:
     """Tests for Location model."""
 
-    def test_creation(self):
+    def test_creation(self, location_full):
         """Test creating a location."""
-        loc = Location(
-            northing=100.0,
-            easting=200.0,
-            vertical=300.0,
-        )
+        loc = location_full
         assert loc.northing == 100.0
         assert loc.easting == 200.0
         assert loc.vertical == 300.0
@@ -97,25 +119,17 @@ class TestLocation:
         assert loc.easting is None
         assert loc.vertical is None
 
-    def test_str(self):
+    def test_str(self, location_full):
         """Test string representation."""
-        loc = Location(
-            northing=100.0,
-            easting=200.0,
-            vertical=300.0,
-        )
-        result = str(loc)
-        assert "northing=100.0" in result
-        assert "easting=200.0" in result
-        assert "vertical=300.0" in result
+        assert _LOC_STR_RE.search(str(location_full))
 
 
 class TestBounds:
     """Tests for Bounds model."""
 
-    def test_creation(self):
+    def test_creation(self, bounds_default):
         """Test creating bounds."""
-        bounds = Bounds()
+        bounds = bounds_default
         assert bounds.lower is not None
         assert bounds.upper is not None
 
@@ -128,9 +142,9 @@ class TestBounds:
         assert bounds.lower.northing == 100.0
         assert bounds.upper.northing == 400.0
 
-    def test_default_locations(self):
+    def test_default_locations(self, bounds_default):
         """Test that default locations have None values."""
-        bounds = Bounds()
+        bounds = bounds_default
         assert bounds.lower.northing is None
         assert bounds.upper.northing is None
 
@@ -175,35 +189,26 @@ class TestUTMLocation:
         )
         assert loc.convergence == 1.5
 
-    def test_validation_easting_too_low(self):
-        """Test that easting below valid range raises error."""
-        with pytest.raises(ValueError, match="easting"):
-            UTMLocation(
-                easting=100000.0,  # Below 166000
-                northing=4000000.0,
-                elevation=100.0,
-                zone=13,
-            )
-
-    def test_validation_zone_too_low(self):
-        """Test that zone below 1 raises error."""
-        with pytest.raises(ValueError, match="zone"):
-            UTMLocation(
-                easting=500000.0,
-                northing=4000000.0,
-                elevation=100.0,
-                zone=0,
-            )
-
-    def test_validation_zone_too_high(self):
-        """Test that zone above 60 raises error."""
-        with pytest.raises(ValueError, match="zone"):
-            UTMLocation(
-                easting=500000.0,
-                northing=4000000.0,
-                elevation=100.0,
-                zone=61,
-            )
+    @pytest.mark.parametrize(
+        ("overrides", "match"),
+        [
+            pytest.param({"easting": 100000.0}, _RE_EASTING, id="easting_too_low"),
+            pytest.param({"zone": 0}, _RE_ZONE_ZERO, id="zone_zero"),
+            pytest.param({"zone": 61}, _RE_ZONE, id="zone_too_high"),
+            pytest.param({"zone": -61}, _RE_ZONE, id="zone_too_negative"),
+        ],
+    )
+    def test_validation(self, overrides, match):
+        """Test that an out-of-range easting or zone raises error."""
+        params = {
+            "easting": 500000.0,
+            "northing": 4000000.0,
+            "elevation": 100.0,
+            "zone": 13,
+            **overrides,
+        }
+        with pytest.raises(ValueError, match=match):
+            UTMLocation(**params)
 
     def test_southern_hemisphere_zone(self):
         """Test creating location with negative zone (southern hemisphere)."""
@@ -229,25 +234,23 @@ class TestUTMLocation:
         assert loc.is_northern_hemisphere is True
         assert loc.zone_number == 33
 
-    def test_zone_zero_rejected(self):
-        """Test that zone 0 is rejected."""
-        with pytest.raises(ValueError, match="cannot be 0"):
-            UTMLocation(
-                easting=500000.0,
-                northing=6000000.0,
-                elevation=100.0,
-                zone=0,
-            )
 
-    def test_zone_too_negative(self):
-        """Test that zone below -60 raises error."""
-        with pytest.raises(ValueError, match="zone"):
-            UTMLocation(
-                easting=500000.0,
-                northing=6000000.0,
-                elevation=100.0,
-                zone=-61,
-            )
+@pytest.fixture(scope="module")
+def sample_utm_location(boulder_utm_coords):
+    """UTMLocation built once from `boulder_utm_coords` (datum unset)."""
+    return UTMLocation(**boulder_utm_coords)
+
+
+@pytest.fixture(scope="module")
+def sample_utm_latlon(sample_utm_location):
+    """Result of `sample_utm_location.to_latlon()`, computed once."""
+    return sample_utm_location.to_latlon()
+
+
+@pytest.fixture(scope="module")
+def latlon_for_datum(request, boulder_utm_coords):
+    """Lat/lon of `boulder_utm_coords` with the (indirectly parametrized) datum."""
+    return UTMLocation(**boulder_utm_coords, datum=request.param).to_latlon()
 
 
 class TestUTMLocationToLatLon:
@@ -257,21 +260,9 @@ class TestUTMLocationToLatLon:
     regardless of what datum is specified in the UTMLocation model.
     """
 
-    @pytest.fixture
-    def sample_utm_coords(self):
-        """Sample UTM coordinates for testing (Boulder, CO area)."""
-        return {
-            "easting": 476516.0,
-            "northing": 4429320.0,
-            "elevation": 1655.0,
-            "zone": 13,
-            "convergence": 0.0,
-        }
-
-    def test_to_latlon_basic(self, sample_utm_coords):
+    def test_to_latlon_basic(self, sample_utm_latlon):
         """Test basic conversion to lat/lon."""
-        loc = UTMLocation(**sample_utm_coords)
-        lat, lon = loc.to_latlon()
+        lat, lon = sample_utm_latlon
 
         # These are approximate values for Boulder, CO
         assert isinstance(lat, float)
@@ -279,47 +270,18 @@ class TestUTMLocationToLatLon:
         assert 39.9 < lat < 40.1  # Boulder is around 40°N
         assert -105.4 < lon < -105.2  # Boulder is around -105.3°W
 
-    def test_to_latlon_returns_tuple(self, sample_utm_coords):
+    def test_to_latlon_returns_tuple(self, sample_utm_latlon):
         """Test that to_latlon returns a tuple of (lat, lon)."""
-        loc = UTMLocation(**sample_utm_coords)
-        result = loc.to_latlon()
+        result = sample_utm_latlon
 
         assert isinstance(result, tuple)
         assert len(result) == 2
         assert isinstance(result[0], float)
         assert isinstance(result[1], float)
 
-    @pytest.mark.parametrize(
-        "datum_value",
-        [
-            None,
-            Datum.ADINDAN,
-            Datum.ARC_1950,
-            Datum.ARC_1960,
-            Datum.AUSTRALIAN_1966,
-            Datum.AUSTRALIAN_1984,
-            Datum.CAMP_AREA_ASTRO,
-            Datum.CAPE,
-            Datum.EUROPEAN_1950,
-            Datum.EUROPEAN_1979,
-            Datum.GEODETIC_1949,
-            Datum.HONG_KONG_1963,
-            Datum.HU_TZU_SHAN,
-            Datum.INDIAN,
-            Datum.NORTH_AMERICAN_1927,
-            Datum.NORTH_AMERICAN_1983,
-            Datum.OMAN,
-            Datum.ORDNANCE_SURVEY_1936,
-            Datum.PULKOVO_1942,
-            Datum.SOUTH_AMERICAN_1956,
-            Datum.SOUTH_AMERICAN_1969,
-            Datum.TOKYO,
-            Datum.WGS_1972,
-            Datum.WGS_1984,
-        ],
-    )
+    @pytest.mark.parametrize("datum_value", _DATUMS_PLUS_NONE, ids=_datum_id)
     def test_to_latlon_consistent_regardless_of_datum(
-        self, sample_utm_coords, datum_value
+        self, boulder_utm_coords, datum_value
     ):
         """Test that to_latlon produces consistent results regardless of datum.
 
@@ -327,9 +289,7 @@ class TestUTMLocationToLatLon:
         so all datum values (including None) should produce identical results.
         """
         # Create location with the specified datum
-        coords_with_datum = sample_utm_coords.copy()
-        coords_with_datum["datum"] = datum_value
-        loc = UTMLocation(**coords_with_datum)
+        loc = UTMLocation(**boulder_utm_coords, datum=datum_value)
 
         lat, lon = loc.to_latlon()
 
@@ -340,121 +300,88 @@ class TestUTMLocationToLatLon:
         assert 39.9 < lat < 40.1
         assert -105.4 < lon < -105.2
 
-    def test_to_latlon_all_datums_produce_identical_results(self, sample_utm_coords):
+    @pytest.mark.parametrize(
+        "latlon_for_datum",
+        _DATUMS_PLUS_NONE,
+        ids=_datum_id,
+        indirect=True,
+    )
+    def test_to_latlon_all_datums_produce_identical_results(
+        self, latlon_for_datum, sample_utm_latlon
+    ):
         """Test that all datum values produce exactly the same lat/lon output.
 
         This verifies the design intent: to_latlon() ignores the datum field
         and always uses WGS 1984 for consistency.
         """
-        results = {}
-
-        # Test with None first
-        loc_none = UTMLocation(**sample_utm_coords, datum=None)
-        results["None"] = loc_none.to_latlon()
-
-        # Test with each datum
-        for datum in Datum:
-            coords_with_datum = sample_utm_coords.copy()
-            coords_with_datum["datum"] = datum
-            loc = UTMLocation(**coords_with_datum)
-            results[datum.value] = loc.to_latlon()
-
-        # Verify all results are identical
-        reference_result = results["None"]
-        for datum_name, result in results.items():
-            assert result == reference_result, (
-                f"Result for datum '{datum_name}' differs from None: "
-                f"{result} != {reference_result}"
-            )
+        # The reference is the conversion with datum=None
+        assert latlon_for_datum == sample_utm_latlon
 
-    def test_to_latlon_precision(self, sample_utm_coords):
+    def test_to_latlon_precision(self, sample_utm_latlon):
         """Test that to_latlon produces results with expected precision."""
-        loc = UTMLocation(**sample_utm_coords)
-        lat, lon = loc.to_latlon()
-
-        # Should have reasonable precision (at least 6 decimal places)
-        lat_str = f"{lat:.10f}"
-        lon_str = f"{lon:.10f}"
+        lat, lon = sample_utm_latlon
 
-        assert "." in lat_str
-        assert "." in lon_str
-        assert len(lat_str.split(".")[1]) >= 6
-        assert len(lon_str.split(".")[1]) >= 6
+        # Should have reasonable precision (significant beyond 6 decimal places)
+        assert math.modf(lat * 1e6)[0] != 0.0 or math.modf(lon * 1e6)[0] != 0.0
 
-    def test_to_latlon_different_zones(self):
+    @pytest.mark.parametrize(
+        ("zone", "lat_range", "lon_range"),
+        [
+            pytest.param(10, (35.0, 37.0), (-124.0, -120.0), id="zone10_west_coast"),
+            pytest.param(17, (35.0, 37.0), (-84.0, -80.0), id="zone17_east_coast"),
+        ],
+    )
+    def test_to_latlon_different_zones(self, zone, lat_range, lon_range):
         """Test conversion in different UTM zones."""
-        # Test Zone 10 (West Coast USA)
-        loc_zone10 = UTMLocation(
-            easting=500000.0,
-            northing=4000000.0,
-            elevation=100.0,
-            zone=10,
-        )
-        lat10, lon10 = loc_zone10.to_latlon()
-        assert 35.0 < lat10 < 37.0
-        assert -124.0 < lon10 < -120.0
-
-        # Test Zone 17 (East Coast USA)
-        loc_zone17 = UTMLocation(
-            easting=500000.0,
-            northing=4000000.0,
-            elevation=100.0,
-            zone=17,
-        )
-        lat17, lon17 = loc_zone17.to_latlon()
-        assert 35.0 < lat17 < 37.0
-        assert -84.0 < lon17 < -80.0
-
-    def test_to_latlon_northern_hemisphere(self):
-        """Test conversion for northern hemisphere coordinates."""
-        # High latitude northern hemisphere
         loc = UTMLocation(
             easting=500000.0,
-            northing=7000000.0,  # ~63°N
+            northing=4000000.0,
             elevation=100.0,
-            zone=33,
+            zone=zone,
         )
-        lat, _ = loc.to_latlon()
-
-        assert 62.0 < lat < 64.0  # Around 63°N
-        assert lat > 0  # Northern hemisphere
+        lat, lon = loc.to_latlon()
+        assert lat_range[0] < lat < lat_range[1]
+        assert lon_range[0] < lon < lon_range[1]
 
-    def test_to_latlon_equatorial(self):
-        """Test conversion for near-equatorial coordinates."""
+    @pytest.mark.parametrize(
+        ("northing", "zone", "lat_range"),
+        [
+            # High latitude northern hemisphere, around 63°N
+            pytest.param(7000000.0, 33, (62.0, 64.0), id="northern_hemisphere"),
+            pytest.param(500000.0, 18, (-5.0, 10.0), id="equatorial"),
+        ],
+    )
+    def test_to_latlon_latitude_band(self, northing, zone, lat_range):
+        """Test conversion lands in the expected latitude band."""
         loc = UTMLocation(
             easting=500000.0,
-            northing=500000.0,  # Near equator
+            northing=northing,
             elevation=100.0,
-            zone=18,
+            zone=zone,
         )
         lat, _ = loc.to_latlon()
 
-        assert -5.0 < lat < 10.0  # Near equator
+        assert lat_range[0] < lat < lat_range[1]
 
     @pytest.mark.parametrize("datum", [Datum.WGS_1984, Datum.NORTH_AMERICAN_1927, None])
-    def test_to_latlon_with_convergence(self, sample_utm_coords, datum):
+    @pytest.mark.parametrize("convergence", [0.0, 2.5])
+    def test_to_latlon_with_convergence(
+        self, boulder_utm_coords, sample_utm_latlon, datum, convergence
+    ):
         """Test that convergence doesn't affect lat/lon conversion.
 
         Convergence is used for bearing adjustments, not coordinate conversion.
         """
-        coords_no_conv = sample_utm_coords.copy()
-        coords_no_conv["datum"] = datum
-        coords_no_conv["convergence"] = 0.0
-
-        coords_with_conv = sample_utm_coords.copy()
-        coords_with_conv["datum"] = datum
-        coords_with_conv["convergence"] = 2.5
-
-        loc_no_conv = UTMLocation(**coords_no_conv)
-        loc_with_conv = UTMLocation(**coords_with_conv)
-
-        result_no_conv = loc_no_conv.to_latlon()
-        result_with_conv = loc_with_conv.to_latlon()
+        loc = UTMLocation(
+            **{**boulder_utm_coords, "datum": datum, "convergence": convergence}
+        )
 
-        # Results should be identical (convergence doesn't affect conversion)
-        assert result_no_conv == result_with_conv
+        # Results should match the datum=None, zero-convergence reference
+        assert loc.to_latlon() == sample_utm_latlon
 
-    def test_to_latlon_documentation_matches_behavior(self, sample_utm_coords):
+    def test_to_latlon_documentation_matches_behavior(
+        self, boulder_utm_coords, sample_utm_latlon
+    ):
         """Test that the documented behavior matches actual behavior.
 
         Documentation states: "This method takes the decision to exclusively
@@ -462,13 +389,12 @@ class TestUTMLocationToLatLon:
         project file."
         """
         # Test with a non-WGS84 datum
-        loc_nad27 = UTMLocation(**sample_utm_coords, datum=Datum.NORTH_AMERICAN_1927)
-        loc_wgs84 = UTMLocation(**sample_utm_coords, datum=Datum.WGS_1984)
-        loc_none = UTMLocation(**sample_utm_coords, datum=None)
+        loc_nad27 = UTMLocation(**boulder_utm_coords, datum=Datum.NORTH_AMERICAN_1927)
+        loc_wgs84 = UTMLocation(**boulder_utm_coords, datum=Datum.WGS_1984)
 
         result_nad27 = loc_nad27.to_latlon()
         result_wgs84 = loc_wgs84.to_latlon()
-        result_none = loc_none.to_latlon()
+        result_none = sample_utm_latlon  # datum=None
 
         # All should produce identical results (WGS 1984 is always used)
         assert result_nad27 == result_wgs84
@@ -479,64 +405,44 @@ class TestUTMLocationToLatLon:
 class TestUTMLocationSouthernHemisphere:
     """Tests for UTMLocation in southern hemisphere (negative zones)."""
 
-    def test_southern_hemisphere_sydney_area(self):
-        """Test coordinate conversion for Sydney, Australia area (Zone 56S)."""
-        # Sydney area coordinates in UTM Zone 56S
-        loc = UTMLocation(
-            easting=334000.0,
-            northing=6252000.0,
-            elevation=50.0,
-            zone=-56,  # Southern hemisphere
-        )
-
-        assert loc.is_northern_hemisphere is False
-        assert loc.zone_number == 56
-
-        lat, lon = loc.to_latlon()
-
-        # Sydney is around -33.87°S, 151.21°E
-        # These coordinates should give approximately -33.8°S
-        assert -34.5 < lat < -33.0  # Southern latitude (negative)
-        assert 150.5 < lon < 152.0  # Eastern longitude
-        assert lat < 0  # Verify southern hemisphere
-
-    def test_southern_hemisphere_buenos_aires_area(self):
-        """Test coordinate conversion for Buenos Aires, Argentina area (Zone 21S)."""
-        # Buenos Aires area coordinates
-        loc = UTMLocation(
-            easting=367000.0,
-            northing=6177000.0,
-            elevation=25.0,
-            zone=-21,  # Southern hemisphere
-        )
-
-        assert loc.is_northern_hemisphere is False
-        assert loc.zone_number == 21
-
-        lat, lon = loc.to_latlon()
-
-        # Buenos Aires is around -34.6°S, -58.4°W
-        assert -36.0 < lat < -33.0  # Southern latitude
-        assert -60.0 < lon < -57.0  # Western longitude
-        assert lat < 0  # Verify southern hemisphere
-
-    def test_southern_hemisphere_south_africa_area(self):
-        """Test coordinate conversion for South Africa area (Zone 35S)."""
-        loc = UTMLocation(
-            easting=275000.0,
-            northing=6200000.0,
-            elevation=1400.0,
-            zone=-35,  # Southern hemisphere
-        )
+    @pytest.mark.parametrize(
+        ("coords_fixture", "zone_number", "lat_range", "lon_range"),
+        [
+            # Sydney is around -33.87°S, 151.21°E
+            pytest.param(
+                "sydney_utm_coords", 56, (-34.5, -33.0), (150.5, 152.0), id="sydney"
+            ),
+            # Buenos Aires is around -34.6°S, -58.4°W
+            pytest.param(
+                "buenos_aires_utm_coords",
+                21,
+                (-36.0, -33.0),
+                (-60.0, -57.0),
+                id="buenos_aires",
+            ),
+            # Zone 35S spans a wide longitude range
+            pytest.param(
+                "south_africa_utm_coords",
+                35,
+                (-35.0, -32.0),
+                (17.0, 26.0),
+                id="south_africa",
+            ),
+        ],
+    )
+    def test_southern_hemisphere_area(
+        self, request, coords_fixture, zone_number, lat_range, lon_range
+    ):
+        """Test coordinate conversion for southern hemisphere reference areas."""
+        loc = UTMLocation(**request.getfixturevalue(coords_fixture))
 
         assert loc.is_northern_hemisphere is False
-        assert loc.zone_number == 35
+        assert loc.zone_number == zone_number
 
         lat, lon = loc.to_latlon()
 
-        # Should be in South Africa region (Zone 35S)
-        assert -35.0 < lat < -32.0  # Southern latitude
-        assert 17.0 < lon < 26.0  # Eastern longitude (Zone 35 spans wide range)
+        assert lat_range[0] < lat < lat_range[1]
+        assert lon_range[0] < lon < lon_range[1]
         assert lat < 0  # Verify southern hemisphere
 
     def test_southern_vs_northern_same_zone_number(self):
@@ -3,7 +3,7 @@
 
 from datetime import date
 from decimal import Decimal
-from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
@@ -20,6 +20,31 @@ from compass_lib.plot.models import FeatureCommand
 from compass_lib.plot.models import SurveyBoundsCommand
 from compass_lib.plot.models import UtmZoneCommand
 from compass_lib.plot.parser import CompassPlotParser
+from tests.conftest import ARTIFACTS_DIR
+
+
+@pytest.fixture(scope="module")
+def shared_parser():
+    """One CompassPlotParser reused by every parser test in this module."""
+    return CompassPlotParser()
+
+
+@pytest.fixture
+def parser(shared_parser):
+    """Return the shared parser reset to the state of a fresh instance."""
+    shared_parser.errors.clear()
+    shared_parser.commands.clear()
+    shared_parser._names.clear()  # noqa: SLF001
+    shared_parser._source = "<string>"  # noqa: SLF001
+    return shared_parser
+
+
+@pytest.fixture(scope="module")
+def simple_plt():
+    """Parse `simple.plt` once for the read-only whole-file tests."""
+    plt_parser = CompassPlotParser()
+    commands = plt_parser.parse_file(ARTIFACTS_DIR / "simple.plt")
+    return SimpleNamespace(commands=commands, errors=plt_parser.errors)
 
 
 class TestBeginSurveyCommand:
@@ -43,16 +68,12 @@ class TestBeginSurveyCommand:
             date=date(1994, 6, 29),
             comment="Stream Passage",
         )
-        result = str(cmd)
-        assert result.startswith("NZ+")
-        assert "D 6 29 1994" in result
-        assert "CStream Passage" in result
+        assert str(cmd) == "NZ+\tD 6 29 1994\tCStream Passage"
 
     def test_str_without_date(self):
         """Test string representation without date."""
         cmd = BeginSurveyCommand(survey_name="TEST")
-        result = str(cmd)
-        assert "D 1 1 1" in result
+        assert str(cmd) == "NTEST\tD 1 1 1"
 
 
 class TestBeginSectionCommand:
@@ -213,9 +234,8 @@ class TestUtmZoneCommand:
 class TestCompassPlotParser:
     """Tests for CompassPlotParser."""
 
-    def test_parse_draw_command(self):
+    def test_parse_draw_command(self, parser):
         """Test parsing M/D commands."""
-        parser = CompassPlotParser()
         line = "D   128.2   -65.9   -86.8  SZ7  P    0.0    3.0    1.0    2.0  I   21.8"
         cmd = parser._parse_command(line, 0)  # noqa: SLF001
 
@@ -231,18 +251,28 @@ class TestCompassPlotParser:
         assert cmd.right == pytest.approx(2.0)
         assert cmd.distance_from_entrance == pytest.approx(21.8)
 
-    def test_parse_move_command(self):
+    def test_parse_draw_command_trailing_fields(self, parser):
+        """Test that undocumented fields after the distance are ignored."""
+        line = "D 128.2 -65.9 -86.8 SZ7 P 999 3.0 1.0 2.0 I 21.8 CX 1 2"
+        cmd = parser._parse_command(line, 0)  # noqa: SLF001
+
+        assert isinstance(cmd, DrawSurveyCommand)
+        assert cmd.station_name == "Z7"
+        assert cmd.left is None
+        assert cmd.right == pytest.approx(2.0)
+        assert cmd.distance_from_entrance == pytest.approx(21.8)
+        assert len(parser.errors) == 0
+
+    def test_parse_move_command(self, parser):
         """Test parsing M command."""
-        parser = CompassPlotParser()
         line = "M   123.5   -70.2   -87.1  SZ6  P    1.5    1.0    0.5    0.5  I    0.0"
         cmd = parser._parse_command(line, 0)  # noqa: SLF001
 
         assert isinstance(cmd, DrawSurveyCommand)
         assert cmd.operation == DrawOperation.MOVE_TO
 
-    def test_parse_begin_survey(self):
+    def test_parse_begin_survey(self, parser):
         """Test parsing N command."""
-        parser = CompassPlotParser()
         line = "NZ+ D 6 29 1994 CStream Passage"
         cmd = parser._parse_command(line, 0)  # noqa: SLF001
 
@@ -251,27 +281,24 @@ class TestCompassPlotParser:
         assert cmd.date == date(1994, 6, 29)
         assert cmd.comment == "Stream Passage"
 
-    def test_parse_begin_section(self):
+    def test_parse_begin_section(self, parser):
         """Test parsing S command."""
-        parser = CompassPlotParser()
         line = "SFULFORD CAVE"
         cmd = parser._parse_command(line, 0)  # noqa: SLF001
 
         assert isinstance(cmd, BeginSectionCommand)
         assert cmd.section_name == "FULFORD CAVE"
 
-    def test_parse_begin_feature(self):
+    def test_parse_begin_feature(self, parser):
         """Test parsing F command."""
-        parser = CompassPlotParser()
         line = "FINSECTS"
         cmd = parser._parse_command(line, 0)  # noqa: SLF001
 
         assert isinstance(cmd, BeginFeatureCommand)
         assert cmd.feature_name == "INSECTS"
 
-    def test_parse_begin_feature_with_range(self):
+    def test_parse_begin_feature_with_range(self, parser):
         """Test parsing F command with range."""
-        parser = CompassPlotParser()
         line = "FWATER R 5.51234E2  8.12341E2"
         cmd = parser._parse_command(line, 0)  # noqa: SLF001
 
@@ -280,9 +307,16 @@ class TestCompassPlotParser:
         assert cmd.min_value == Decimal("5.51234E2")
         assert cmd.max_value == Decimal("8.12341E2")
 
-    def test_parse_feature_command(self):
+    def test_parse_begin_feature_invalid_range_generates_error(self, parser):
+        """Test that a non-decimal feature range generates an error."""
+        cmd = parser._parse_command("FWATER R abc 8.12341E2", 0)  # noqa: SLF001
+
+        assert isinstance(cmd, BeginFeatureCommand)
+        assert cmd.min_value is None
+        assert [e.message for e in parser.errors] == ["invalid feature range"]
+
+    def test_parse_feature_command(self, parser):
         """Test parsing L command."""
-        parser = CompassPlotParser()
         line = "L     0.0     0.0     0.0  SA1 P -9.0 -9.0 -9.0 -9.0"
         cmd = parser._parse_command(line, 0)  # noqa: SLF001
 
@@ -293,18 +327,16 @@ class TestCompassPlotParser:
         assert cmd.left is None
         assert cmd.right is None
 
-    def test_parse_feature_command_with_value(self):
+    def test_parse_feature_command_with_value(self, parser):
         """Test parsing L command with value."""
-        parser = CompassPlotParser()
         line = "L     0.0     0.0     0.0  SA1 P -9.0 -9.0 -9.0 -9.0 V 5.51234E2"
         cmd = parser._parse_command(line, 0)  # noqa: SLF001
 
         assert isinstance(cmd, FeatureCommand)
         assert cmd.value == Decimal("5.51234E2")
 
-    def test_parse_survey_bounds(self):
+    def test_parse_survey_bounds(self, parser):
         """Test parsing X command."""
-        parser = CompassPlotParser()
         line = "X     118.78    138.22    -82.94    -63.34   -101.90    -82.53"
         cmd = parser._parse_command(line, 0)  # noqa: SLF001
 
@@ -312,9 +344,8 @@ class TestCompassPlotParser:
         assert cmd.bounds.lower.northing == pytest.approx(118.78)
         assert cmd.bounds.upper.northing == pytest.approx(138.22)
 
-    def test_parse_cave_bounds(self):
+    def test_parse_cave_bounds(self, parser):
         """Test parsing Z command."""
-        parser = CompassPlotParser()
         line = (
             "Z    -129.26    319.44    -94.30    439.00   -130.05    126.30  I 1357.3"
         )
@@ -325,9 +356,8 @@ class TestCompassPlotParser:
         assert cmd.bounds.upper.northing == pytest.approx(319.44)
         assert cmd.distance_to_farthest_station == pytest.approx(1357.3)
 
-    def test_parse_datum(self):
+    def test_parse_datum(self, parser):
         """Test parsing O command."""
-        parser = CompassPlotParser()
         line = "OAdindan"
         cmd = parser._parse_command(line, 0)  # noqa: SLF001
 
@@ -335,35 +365,43 @@ class TestCompassPlotParser:
         assert cmd.datum == Datum.ADINDAN
         assert isinstance(cmd.datum, Datum)
 
-    def test_parse_utm_zone(self):
+    def test_parse_utm_zone(self, parser):
         """Test parsing G command."""
-        parser = CompassPlotParser()
         line = "G13"
         cmd = parser._parse_command(line, 0)  # noqa: SLF001
 
         assert isinstance(cmd, UtmZoneCommand)
         assert cmd.utm_zone == "13"
 
-    def test_parse_file(self, artifacts_dir: Path):
+    def test_parse_file(self, simple_plt):
         """Test parsing a complete PLT file."""
-        parser = CompassPlotParser()
-        commands = parser.parse_file(artifacts_dir / "simple.plt")
+        commands = simple_plt.commands
 
         assert len(commands) > 0
+        assert len(simple_plt.errors) == 0
+
+        # Check for expected command types (collected in a single pass)
+        present = {type(c) for c in commands}
+        assert {
+            CaveBoundsCommand,
+            BeginSectionCommand,
+            BeginSurveyCommand,
+            DrawSurveyCommand,
+            SurveyBoundsCommand,
+            BeginFeatureCommand,
+            FeatureCommand,
+        } <= present
+
+    def test_parse_file_iter(self, parser, simple_plt):
+        """Test that streaming parse yields the same commands as parse_file."""
+        streamed = list(parser.parse_file_iter(ARTIFACTS_DIR / "simple.plt"))
+
+        assert parser.commands == []
+        assert streamed == simple_plt.commands
         assert len(parser.errors) == 0
 
-        # Check for expected command types
-        assert any(isinstance(c, CaveBoundsCommand) for c in commands)
-        assert any(isinstance(c, BeginSectionCommand) for c in commands)
-        assert any(isinstance(c, BeginSurveyCommand) for c in commands)
-        assert any(isinstance(c, DrawSurveyCommand) for c in commands)
-        assert any(isinstance(c, SurveyBoundsCommand) for c in commands)
-        assert any(isinstance(c, BeginFeatureCommand) for c in commands)
-        assert any(isinstance(c, FeatureCommand) for c in commands)
-
-    def test_parse_blank_lines(self):
+    def test_parse_blank_lines(self, parser):
         """Test that blank lines are skipped."""
-        parser = CompassPlotParser()
         data = """Z    -129.26    319.44    -94.30    439.00   -130.05    126.30  I 1357.3
 
 SFULFORD CAVE
@@ -375,9 +413,24 @@ NZ+ D 6 29 1994
         assert len(commands) == 3
         assert len(parser.errors) == 0
 
-    def test_parse_invalid_lrud_generates_error(self):
+    def test_parse_string_skips_unknown_commands(self, parser):
+        """Test that unknown commands in a stream are skipped without errors."""
+        data = "SFULFORD CAVE\nUNKNOWN COMMAND\n\x1a\nG13\n"
+        commands = parser.parse_string(data)
+
+        assert [type(c) for c in commands] == [BeginSectionCommand, UtmZoneCommand]
+        assert len(parser.errors) == 0
+
+    def test_parse_string_shares_repeated_station_names(self, parser):
+        """Test that repeated station names resolve to one shared string."""
+        data = "M 1 2 3 SZ6 P 1 1 1 1 I 0\nL 1 2 3 SZ6 P 1 1 1 1\nD 1 2 3 S Z6\n"
+        first, *others = parser.parse_string(data)
+
+        assert first.station_name == "Z6"
+        assert all(c.station_name is first.station_name for c in others)
+
+    def test_parse_invalid_lrud_generates_error(self, parser):
         """Test that invalid LRUD values generate errors."""
-        parser = CompassPlotParser()
         line = "D   128.2   -65.9   -86.8  SZ7  P    abc    3.0    1.0    2.0  I   21.8"
         cmd = parser._parse_command(line, 0)  # noqa: SLF001
 
@@ -385,9 +438,8 @@ NZ+ D 6 29 1994
         assert len(parser.errors) >= 1
         assert any(e.severity == Severity.ERROR for e in parser.errors)
 
-    def test_parse_negative_distance_generates_warning(self):
+    def test_parse_negative_distance_generates_warning(self, parser):
         """Test that negative distance from entrance generates warning."""
-        parser = CompassPlotParser()
         line = (
             "D   128.2   -65.9   -86.8  SZ7  P    0.0    3.0    1.0    2.0  I   -21.8"
         )
@@ -400,9 +452,8 @@ NZ+ D 6 29 1994
             for e in parser.errors
         )
 
-    def test_null_lrud_values(self):
+    def test_null_lrud_values(self, parser):
         """Test that 999 and 999.9 are treated as null LRUD values."""
-        parser = CompassPlotParser()
         line = (
             "D   128.2   -65.9   -86.8  SZ7  P    999    999.9    0.0    0.0  I   21.8"
         )
@@ -414,13 +465,12 @@ NZ+ D 6 29 1994
         assert cmd.down == pytest.approx(0.0)
         assert cmd.right == pytest.approx(0.0)
 
-    def test_lrud_order_draw_vs_feature(self):
+    def test_lrud_order_draw_vs_feature(self, parser):
         """Test that LRUD order differs between draw and feature commands.
 
         Draw commands: left, up, down, right
         Feature commands: left, right, up, down
         """
-        parser = CompassPlotParser()
 
         # Draw command: P <left> <up> <down> <right>
         draw_line = "D   0   0   0  SA1  P    1.0    2.0    3.0    4.0  I   0"
@@ -434,8 +484,7 @@ NZ+ D 6 29 1994
 
         # Feature command: P <left> <right> <up> <down>
         feature_line = "L   0   0   0  SA1  P    1.0    2.0    3.0    4.0"
-        parser2 = CompassPlotParser()
-        feature_cmd = parser2._parse_command(feature_line, 0)  # noqa: SLF001
+        feature_cmd = parser._parse_command(feature_line, 0)  # noqa: SLF001
 
         assert isinstance(feature_cmd, FeatureCommand)
         assert feature_cmd.left == pytest.approx(1.0)
@@ -443,9 +492,8 @@ NZ+ D 6 29 1994
         assert feature_cmd.up == pytest.approx(3.0)
         assert feature_cmd.down == pytest.approx(4.0)
 
-    def test_unknown_command_ignored(self):
+    def test_unknown_command_ignored(self, parser):
         """Test that unknown commands are silently ignored."""
-        parser = CompassPlotParser()
         cmd = parser._parse_command("UNKNOWN COMMAND", 0)  # noqa: SLF001
 
         assert cmd is None
@@ -1,8 +1,6 @@
 # -*- coding: utf-8 -*-
 """Tests for project module."""
 
-from pathlib import Path
-
 import pytest
 
 from compass_lib.errors import CompassParseException
@@ -20,8 +18,132 @@ from compass_lib.project.models import UnknownDirective
 from compass_lib.project.models import UTMConvergenceDirective
 from compass_lib.project.models import UTMZoneDirective
 from compass_lib.project.parser import CompassProjectParser
+from tests.conftest import ARTIFACTS_DIR
+
 
+@pytest.fixture(scope="module")
+def parser() -> CompassProjectParser:
+    """One CompassProjectParser reused by every parser test in this module.
 
+    The parser resets its position and source on each `parse_*` call, so no
+    state carries over between tests.
+    """
+    return CompassProjectParser()
+
+
+def _parse_one(parser: CompassProjectParser, text: str, cls: type):
+    """Parse `text`, check it holds exactly one `cls` directive, and return it."""
+    directives = parser.parse_string(text)
+    assert len(directives) == 1
+    assert isinstance(directives[0], cls)
+    return directives[0]
+
+
+def _group_by_type(directives) -> dict[type, list]:
+    """Group directives by their exact type in a single pass."""
+    by_type: dict[type, list] = {}
+    for directive in directives:
+        by_type.setdefault(type(directive), []).append(directive)
+    return by_type
+
+
+@pytest.fixture(scope="module")
+def simple_mak_directives() -> list:
+    """Parse `simple.mak` once for the read-only whole-file tests."""
+    return CompassProjectParser().parse_file(ARTIFACTS_DIR / "simple.mak")
+
+
+@pytest.fixture(scope="module")
+def link_stations_mak_directives() -> list:
+    """Parse `link_stations.mak` once for the read-only whole-file tests."""
+    return CompassProjectParser().parse_file(ARTIFACTS_DIR / "link_stations.mak")
+
+
+# (directive, expected str) round-trip cases; the expected text doubles as id.
+_STR_CASES = [
+    (CommentDirective(comment="Test comment"), "/ Test comment"),
+    (FolderStartDirective(name="Folder-1"), "[Folder-1;"),
+    (FolderEndDirective(), "];"),
+    (DatumDirective(datum="North American 1983"), "&North American 1983;"),
+    (UTMZoneDirective(utm_zone=13), "$13;"),
+    (UTMZoneDirective(utm_zone=-13), "$-13;"),
+    (UTMConvergenceDirective(utm_convergence=2.04, enabled=True), "%2.040;"),
+    (UTMConvergenceDirective(utm_convergence=0.0, enabled=False), "*0.000;"),
+    (FileDirective(file="ENTRANCE.DAT"), "#ENTRANCE.DAT;"),
+    (
+        LocationDirective(
+            easting=123.45,
+            northing=345.678,
+            elevation=10234.0,
+            utm_zone=13,
+            utm_convergence=2.04,
+        ),
+        "@123.450,345.678,10234.000,13,2.040;",
+    ),
+]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("directive", "expected"),
+    _STR_CASES,
+    ids=[expected for _, expected in _STR_CASES],
+)
+def test_directive_str(directive, expected: str):
+    """Test the string representation of each directive type."""
+    assert str(directive) == expected
+
+
+# (flags text, expected attributes) for the flags parser tests. The all-10 case
+# is the example from the Compass documentation.
+_FLAG_PARSE_CASES = [
+    ("!ot;", {"is_override_lruds": False, "is_lruds_at_to_station": False}),
+    ("!OT;", {"is_override_lruds": True, "is_lruds_at_to_station": True}),
+    (
+        "!GAVOTSCXPL;",
+        {
+            "global_override": True,  # G
+            "declination_mode": DeclinationMode.AUTO,  # A
+            "apply_utm_convergence": True,  # V
+            "override_lruds": True,  # O
+            "lruds_at_to_station": True,  # T
+            "apply_shot_flags": True,  # S
+            "apply_close_exclusion": True,  # C
+            "apply_total_exclusion": True,  # X
+            "apply_plotting_exclusion": True,  # P
+            "apply_length_exclusion": True,  # L
+        },
+    ),
+    (
+        "!gIvotscxpl;",
+        {
+            "global_override": False,  # g
+            "declination_mode": DeclinationMode.IGNORE,  # I
+            "apply_utm_convergence": False,  # v
+            "raw_flags": "gIvotscxpl",  # preserved for roundtrip
+        },
+    ),
+    ("!gEvotscxpl;", {"declination_mode": DeclinationMode.ENTERED}),  # E
+]
+
+
+# Legacy FlagsDirective bitmask values.
+_OVERRIDE_LRUDS = FlagsDirective.OVERRIDE_LRUDS
+_LRUDS_AT_TO_STATION = FlagsDirective.LRUDS_AT_TO_STATION
+
+# Boolean FlagsDirective fields toggled by a single upper/lower-case letter.
+_BOOL_FLAGS = [
+    "global_override",
+    "apply_utm_convergence",
+    "apply_shot_flags",
+    "apply_total_exclusion",
+    "apply_plotting_exclusion",
+    "apply_length_exclusion",
+    "apply_close_exclusion",
+]
+
+
+@pytest.mark.unit
 class TestCommentDirective:
     """Tests for CommentDirective model."""
 
@@ -30,12 +152,8 @@ class TestCommentDirective:
         directive = CommentDirective(comment="This is a comment")
         assert directive.comment == "This is a comment"
 
-    def test_str(self):
-        """Test string representation."""
-        directive = CommentDirective(comment="Test comment")
-        assert str(directive) == "/ Test comment"
-
 
+@pytest.mark.unit
 class TestFolderStartDirective:
     """Tests for FolderStartDirective model."""
 
@@ -45,12 +163,8 @@ class TestFolderStartDirective:
         assert directive.name == "Mouse Palace"
         assert directive.type == "folder_start"
 
-    def test_str(self):
-        """Test string representation."""
-        directive = FolderStartDirective(name="Folder-1")
-        assert str(directive) == "[Folder-1;"
-
 
+@pytest.mark.unit
 class TestFolderEndDirective:
     """Tests for FolderEndDirective model."""
 
@@ -59,12 +173,8 @@ class TestFolderEndDirective:
         directive = FolderEndDirective()
         assert directive.type == "folder_end"
 
-    def test_str(self):
-        """Test string representation."""
-        directive = FolderEndDirective()
-        assert str(directive) == "];"
-
 
+@pytest.mark.unit
 class TestDatumDirective:
     """Tests for DatumDirective model."""
 
@@ -73,82 +183,52 @@ class TestDatumDirective:
         directive = DatumDirective(datum="North American 1983")
         assert directive.datum == "North American 1983"
 
-    def test_str(self):
-        """Test string representation."""
-        directive = DatumDirective(datum="North American 1983")
-        assert str(directive) == "&North American 1983;"
-
 
+@pytest.mark.unit
 class TestUTMZoneDirective:
     """Tests for UTMZoneDirective model."""
 
-    def test_creation(self):
-        """Test creating a UTM zone directive."""
-        directive = UTMZoneDirective(utm_zone=13)
-        assert directive.utm_zone == 13
-
-    def test_str(self):
-        """Test string representation."""
-        directive = UTMZoneDirective(utm_zone=13)
-        assert str(directive) == "$13;"
-
-    def test_validation_too_low(self):
-        """Test that zone < 1 raises ValueError."""
-        with pytest.raises(ValueError, match="UTM zone"):
-            UTMZoneDirective(utm_zone=0)
-
-    def test_validation_too_high(self):
-        """Test that zone > 60 raises ValueError."""
-        with pytest.raises(ValueError, match="UTM zone"):
-            UTMZoneDirective(utm_zone=61)
-
-    def test_southern_hemisphere_zone(self):
-        """Test creating directive with negative zone (southern hemisphere)."""
-        directive = UTMZoneDirective(utm_zone=-13)
-        assert directive.utm_zone == -13
-        assert str(directive) == "$-13;"
-
-    def test_zone_too_negative(self):
-        """Test that zone < -60 raises ValueError."""
-        with pytest.raises(
-            ValueError,
-            match=r".*UTM zone must be between -60 and 60 \(excluding 0\), got -61.*",
-        ):
-            UTMZoneDirective(utm_zone=-61)
-
-
+    @pytest.mark.parametrize("zone", [13, -13])
+    def test_creation(self, zone: int):
+        """Test creating a UTM zone directive (negative is southern hemisphere)."""
+        directive = UTMZoneDirective(utm_zone=zone)
+        assert directive.utm_zone == zone
+
+    @pytest.mark.parametrize(
+        ("zone", "match"),
+        [
+            (0, "UTM zone cannot be 0"),
+            (61, r"UTM zone must be between -60 and 60 \(excluding 0\), got 61"),
+            (-61, r"UTM zone must be between -60 and 60 \(excluding 0\), got -61"),
+        ],
+    )
+    def test_validation_raises(self, zone: int, match: str):
+        """Test that zones outside [-60, 60] or equal to 0 raise ValueError."""
+        with pytest.raises(ValueError, match=match):
+            UTMZoneDirective(utm_zone=zone)
+
+
+@pytest.mark.unit
 class TestUTMConvergenceDirective:
     """Tests for UTMConvergenceDirective model."""
 
-    def test_creation_enabled_default(self):
-        """Test creating a UTM convergence directive defaults to enabled."""
-        directive = UTMConvergenceDirective(utm_convergence=-0.26)
-        assert directive.utm_convergence == pytest.approx(-0.26)
-        assert directive.enabled is True
-
-    def test_creation_enabled_explicit(self):
-        """Test creating a UTM convergence directive with enabled=True."""
-        directive = UTMConvergenceDirective(utm_convergence=1.5, enabled=True)
-        assert directive.utm_convergence == pytest.approx(1.5)
-        assert directive.enabled is True
-
-    def test_creation_disabled(self):
-        """Test creating a UTM convergence directive with enabled=False."""
-        directive = UTMConvergenceDirective(utm_convergence=0.0, enabled=False)
-        assert directive.utm_convergence == pytest.approx(0.0)
-        assert directive.enabled is False
-
-    def test_str_enabled(self):
-        """Test string representation when enabled (% prefix)."""
-        directive = UTMConvergenceDirective(utm_convergence=2.04, enabled=True)
-        assert str(directive) == "%2.040;"
-
-    def test_str_disabled(self):
-        """Test string representation when disabled (* prefix)."""
-        directive = UTMConvergenceDirective(utm_convergence=0.0, enabled=False)
-        assert str(directive) == "*0.000;"
-
-
+    @pytest.mark.parametrize(
+        ("kwargs", "enabled"),
+        [
+            ({"utm_convergence": -0.26}, True),
+            ({"utm_convergence": 1.5, "enabled": True}, True),
+            ({"utm_convergence": 0.0, "enabled": False}, False),
+        ],
+        ids=["enabled_default", "enabled_explicit", "disabled"],
+    )
+    def test_creation(self, kwargs: dict, enabled: bool):
+        """Test creating a UTM convergence directive (enabled by default)."""
+        directive = UTMConvergenceDirective(**kwargs)
+        assert round(directive.utm_convergence, 3) == kwargs["utm_convergence"]
+        assert directive.enabled is enabled
+
+
+@pytest.mark.unit
 class TestFlagsDirective:
     """Tests for FlagsDirective model.
 
@@ -186,73 +266,35 @@ class TestFlagsDirective:
         assert not directive.is_override_lruds
         assert not directive.is_lruds_at_to_station
 
-    def test_global_override_flag(self):
-        """Test G/g global override flag."""
-        directive = FlagsDirective(global_override=True)
-        assert directive.global_override is True
-
-    def test_declination_mode_ignore(self):
-        """Test I declination mode (ignore)."""
-        directive = FlagsDirective(declination_mode=DeclinationMode.IGNORE)
-        assert directive.declination_mode == DeclinationMode.IGNORE
-
-    def test_declination_mode_entered(self):
-        """Test E declination mode (entered)."""
-        directive = FlagsDirective(declination_mode=DeclinationMode.ENTERED)
-        assert directive.declination_mode == DeclinationMode.ENTERED
+    @pytest.mark.parametrize("name", _BOOL_FLAGS)
+    def test_bool_flag(self, name: str):
+        """Test each boolean flag (G, V, S, X, P, L, C) can be enabled."""
+        directive = FlagsDirective(**{name: True})
+        assert getattr(directive, name) is True
 
-    def test_declination_mode_auto(self):
-        """Test A declination mode (auto-calculated)."""
-        directive = FlagsDirective(declination_mode=DeclinationMode.AUTO)
-        assert directive.declination_mode == DeclinationMode.AUTO
-
-    def test_apply_utm_convergence_flag(self):
-        """Test V/v apply UTM convergence flag."""
-        directive = FlagsDirective(apply_utm_convergence=True)
-        assert directive.apply_utm_convergence is True
+    @pytest.mark.parametrize(
+        "mode", list(DeclinationMode), ids=[mode.name for mode in DeclinationMode]
+    )
+    def test_declination_mode(self, mode: DeclinationMode):
+        """Test the I/E/A declination modes (ignore/entered/auto)."""
+        directive = FlagsDirective(declination_mode=mode)
+        assert directive.declination_mode == mode
 
     def test_override_lruds_flag(self):
         """Test O/o override LRUDs flag."""
-        directive = FlagsDirective(flags=FlagsDirective.OVERRIDE_LRUDS)
+        directive = FlagsDirective(flags=_OVERRIDE_LRUDS)
         assert directive.is_override_lruds
         assert not directive.is_lruds_at_to_station
 
     def test_lruds_at_to_station_flag(self):
         """Test T/t LRUDs at TO station flag."""
-        directive = FlagsDirective(flags=FlagsDirective.LRUDS_AT_TO_STATION)
+        directive = FlagsDirective(flags=_LRUDS_AT_TO_STATION)
         assert not directive.is_override_lruds
         assert directive.is_lruds_at_to_station
 
-    def test_apply_shot_flags_flag(self):
-        """Test S/s apply shot flags."""
-        directive = FlagsDirective(apply_shot_flags=True)
-        assert directive.apply_shot_flags is True
-
-    def test_apply_total_exclusion_flag(self):
-        """Test X/x apply total exclusion flags."""
-        directive = FlagsDirective(apply_total_exclusion=True)
-        assert directive.apply_total_exclusion is True
-
-    def test_apply_plotting_exclusion_flag(self):
-        """Test P/p apply plotting exclusion flags."""
-        directive = FlagsDirective(apply_plotting_exclusion=True)
-        assert directive.apply_plotting_exclusion is True
-
-    def test_apply_length_exclusion_flag(self):
-        """Test L/l apply length exclusion flags."""
-        directive = FlagsDirective(apply_length_exclusion=True)
-        assert directive.apply_length_exclusion is True
-
-    def test_apply_close_exclusion_flag(self):
-        """Test C/c apply close exclusion flags."""
-        directive = FlagsDirective(apply_close_exclusion=True)
-        assert directive.apply_close_exclusion is True
-
     def test_both_lrud_flags(self):
         """Test both LRUD flags set (O and T)."""
-        directive = FlagsDirective(
-            flags=FlagsDirective.OVERRIDE_LRUDS | FlagsDirective.LRUDS_AT_TO_STATION
-        )
+        directive = FlagsDirective(flags=_OVERRIDE_LRUDS | _LRUDS_AT_TO_STATION)
         assert directive.is_override_lruds
         assert directive.is_lruds_at_to_station
 
@@ -308,6 +350,7 @@ class TestFlagsDirective:
         assert str(directive) == "!gIvotscxpl;"
 
 
+@pytest.mark.unit
 class TestFileDirective:
     """Tests for FileDirective model."""
 
@@ -335,12 +378,8 @@ class TestFileDirective:
         assert directive.link_stations[0].name == "A1"
         assert directive.link_stations[1].location is None
 
-    def test_str(self):
-        """Test string representation."""
-        directive = FileDirective(file="ENTRANCE.DAT")
-        assert str(directive) == "#ENTRANCE.DAT;"
-
 
+@pytest.mark.unit
 class TestLocationDirective:
     """Tests for LocationDirective model."""
 
@@ -353,198 +392,91 @@ class TestLocationDirective:
             utm_zone=13,
             utm_convergence=-0.26,
         )
-        assert directive.easting == pytest.approx(546866.9)
-        assert directive.northing == pytest.approx(3561472.9)
-        assert directive.elevation == pytest.approx(1414.1)
+        assert round(directive.easting, 3) == 546866.9
+        assert round(directive.northing, 3) == 3561472.9
+        assert round(directive.elevation, 3) == 1414.1
         assert directive.utm_zone == 13
-        assert directive.utm_convergence == pytest.approx(-0.26)
-
-    def test_str(self):
-        """Test string representation."""
-        directive = LocationDirective(
-            easting=123.45,
-            northing=345.678,
-            elevation=10234.0,
-            utm_zone=13,
-            utm_convergence=2.04,
-        )
-        assert str(directive) == "@123.450,345.678,10234.000,13,2.040;"
+        assert round(directive.utm_convergence, 3) == -0.26
 
 
+@pytest.mark.parser
 class TestCompassProjectParser:
     """Tests for CompassProjectParser."""
 
-    def test_parse_location(self):
+    def test_parse_location(self, parser: CompassProjectParser):
         """Test parsing location directive."""
-        parser = CompassProjectParser()
-        directives = parser.parse_string("@546866.900,3561472.900,1414.100,13,-0.260;")
-
-        assert len(directives) == 1
-        loc = directives[0]
-        assert isinstance(loc, LocationDirective)
-        assert loc.easting == pytest.approx(546866.9)
-        assert loc.northing == pytest.approx(3561472.9)
-        assert loc.elevation == pytest.approx(1414.1)
+        loc = _parse_one(
+            parser, "@546866.900,3561472.900,1414.100,13,-0.260;", LocationDirective
+        )
+        assert round(loc.easting, 3) == 546866.9
+        assert round(loc.northing, 3) == 3561472.9
+        assert round(loc.elevation, 3) == 1414.1
         assert loc.utm_zone == 13
-        assert loc.utm_convergence == pytest.approx(-0.26)
+        assert round(loc.utm_convergence, 3) == -0.26
 
-    def test_parse_datum(self):
+    def test_parse_datum(self, parser: CompassProjectParser):
         """Test parsing datum directive."""
-        parser = CompassProjectParser()
-        directives = parser.parse_string("&North American 1983;")
-
-        assert len(directives) == 1
-        assert isinstance(directives[0], DatumDirective)
-        assert directives[0].datum == "North American 1983"
+        directive = _parse_one(parser, "&North American 1983;", DatumDirective)
+        assert directive.datum == "North American 1983"
 
-    def test_parse_utm_zone(self):
+    def test_parse_utm_zone(self, parser: CompassProjectParser):
         """Test parsing UTM zone directive."""
-        parser = CompassProjectParser()
-        directives = parser.parse_string("$13;")
-
-        assert len(directives) == 1
-        assert isinstance(directives[0], UTMZoneDirective)
-        assert directives[0].utm_zone == 13
+        directive = _parse_one(parser, "$13;", UTMZoneDirective)
+        assert directive.utm_zone == 13
 
-    def test_parse_negative_utm_zone(self):
+    def test_parse_negative_utm_zone(self, parser: CompassProjectParser):
         """Test parsing negative UTM zone (southern hemisphere)."""
-        parser = CompassProjectParser()
-        directives = parser.parse_string("$-13;")
-
-        assert len(directives) == 1
-        assert isinstance(directives[0], UTMZoneDirective)
-        assert directives[0].utm_zone == -13
+        directive = _parse_one(parser, "$-13;", UTMZoneDirective)
+        assert directive.utm_zone == -13
 
-    def test_parse_location_with_negative_zone(self):
+    def test_parse_location_with_negative_zone(self, parser: CompassProjectParser):
         """Test parsing location with negative zone (southern hemisphere)."""
-        parser = CompassProjectParser()
         data = "@500000.0,6000000.0,100.0,-33,-1.5;"
-        directives = parser.parse_string(data)
-
-        assert len(directives) == 1
-        assert isinstance(directives[0], LocationDirective)
-        assert directives[0].utm_zone == -33
+        directive = _parse_one(parser, data, LocationDirective)
+        assert directive.utm_zone == -33
 
-    def test_parse_utm_convergence_enabled(self):
+    def test_parse_utm_convergence_enabled(self, parser: CompassProjectParser):
         """Test parsing UTM convergence directive with % (enabled)."""
-        parser = CompassProjectParser()
-        directives = parser.parse_string("%-0.26;")
-
-        assert len(directives) == 1
-        assert isinstance(directives[0], UTMConvergenceDirective)
-        assert directives[0].utm_convergence == pytest.approx(-0.26)
-        assert directives[0].enabled is True
+        directive = _parse_one(parser, "%-0.26;", UTMConvergenceDirective)
+        assert round(directive.utm_convergence, 3) == -0.26
+        assert directive.enabled is True
 
-    def test_parse_utm_convergence_disabled(self):
+    def test_parse_utm_convergence_disabled(self, parser: CompassProjectParser):
         """Test parsing UTM convergence directive with * (disabled)."""
-        parser = CompassProjectParser()
-        directives = parser.parse_string("*0.00;")
-
-        assert len(directives) == 1
-        assert isinstance(directives[0], UTMConvergenceDirective)
-        assert directives[0].utm_convergence == pytest.approx(0.0)
-        assert directives[0].enabled is False
+        directive = _parse_one(parser, "*0.00;", UTMConvergenceDirective)
+        assert round(directive.utm_convergence, 3) == 0.0
+        assert directive.enabled is False
 
-    def test_parse_utm_convergence_disabled_with_value(self):
+    def test_parse_utm_convergence_disabled_with_value(
+        self, parser: CompassProjectParser
+    ):
         """Test parsing disabled UTM convergence with non-zero value."""
-        parser = CompassProjectParser()
-        directives = parser.parse_string("*12.34;")
-
-        assert len(directives) == 1
-        assert isinstance(directives[0], UTMConvergenceDirective)
-        assert directives[0].utm_convergence == pytest.approx(12.34)
-        assert directives[0].enabled is False
-
-    def test_parse_flags_lowercase(self):
-        """Test parsing flags directive with lowercase (all disabled)."""
-        parser = CompassProjectParser()
-        directives = parser.parse_string("!ot;")
-
-        assert len(directives) == 1
-        assert isinstance(directives[0], FlagsDirective)
-        assert not directives[0].is_override_lruds
-        assert not directives[0].is_lruds_at_to_station
-
-    def test_parse_flags_uppercase(self):
-        """Test parsing flags directive with uppercase."""
-        parser = CompassProjectParser()
-        directives = parser.parse_string("!OT;")
-
-        assert len(directives) == 1
-        assert isinstance(directives[0], FlagsDirective)
-        assert directives[0].is_override_lruds
-        assert directives[0].is_lruds_at_to_station
-
-    def test_parse_flags_all_10_flags(self):
-        """Test parsing all 10 flags from documentation example: !GAVOTSCXPL;"""
-        parser = CompassProjectParser()
-        directives = parser.parse_string("!GAVOTSCXPL;")
-
-        assert len(directives) == 1
-        flags = directives[0]
-        assert isinstance(flags, FlagsDirective)
-        assert flags.global_override is True  # G
-        assert flags.declination_mode == DeclinationMode.AUTO  # A
-        assert flags.apply_utm_convergence is True  # V
-        assert flags.override_lruds is True  # O
-        assert flags.lruds_at_to_station is True  # T
-        assert flags.apply_shot_flags is True  # S
-        assert flags.apply_close_exclusion is True  # C
-        assert flags.apply_total_exclusion is True  # X
-        assert flags.apply_plotting_exclusion is True  # P
-        assert flags.apply_length_exclusion is True  # L
-
-    def test_parse_flags_declination_ignore(self):
-        """Test parsing declination mode I (ignore)."""
-        parser = CompassProjectParser()
-        directives = parser.parse_string("!gIvotscxpl;")
-
-        assert len(directives) == 1
-        flags = directives[0]
-        assert isinstance(flags, FlagsDirective)
-        assert flags.global_override is False  # g
-        assert flags.declination_mode == DeclinationMode.IGNORE  # I
-        assert flags.apply_utm_convergence is False  # v
-
-    def test_parse_flags_declination_entered(self):
-        """Test parsing declination mode E (entered)."""
-        parser = CompassProjectParser()
-        directives = parser.parse_string("!gEvotscxpl;")
-
-        assert len(directives) == 1
-        flags = directives[0]
-        assert isinstance(flags, FlagsDirective)
-        assert flags.declination_mode == DeclinationMode.ENTERED  # E
-
-    def test_parse_flags_preserves_raw(self):
-        """Test that raw_flags is preserved for roundtrip."""
-        parser = CompassProjectParser()
-        directives = parser.parse_string("!gIvotscxpl;")
-
-        assert len(directives) == 1
-        flags = directives[0]
-        assert flags.raw_flags == "gIvotscxpl"
-
-    def test_parse_folder_start(self):
-        """Test parsing folder start directive."""
-        parser = CompassProjectParser()
-        directives = parser.parse_string("[Mouse Palace;")
+        directive = _parse_one(parser, "*12.34;", UTMConvergenceDirective)
+        assert round(directive.utm_convergence, 3) == 12.34
+        assert directive.enabled is False
 
-        assert len(directives) == 1
-        assert isinstance(directives[0], FolderStartDirective)
-        assert directives[0].name == "Mouse Palace"
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        _FLAG_PARSE_CASES,
+        ids=["lowercase", "uppercase", "all_10_flags", "decl_ignore", "decl_entered"],
+    )
+    def test_parse_flags(self, parser: CompassProjectParser, text: str, expected: dict):
+        """Test parsing flags directives, including the documentation example."""
+        flags = _parse_one(parser, text, FlagsDirective)
+        for attr, value in expected.items():
+            assert getattr(flags, attr) == value, attr
+
+    def test_parse_folder_start(self, parser: CompassProjectParser):
+        """Test parsing folder start directive."""
+        directive = _parse_one(parser, "[Mouse Palace;", FolderStartDirective)
+        assert directive.name == "Mouse Palace"
 
-    def test_parse_folder_end(self):
+    def test_parse_folder_end(self, parser: CompassProjectParser):
         """Test parsing folder end directive."""
-        parser = CompassProjectParser()
-        directives = parser.parse_string("];")
+        _parse_one(parser, "];", FolderEndDirective)
 
-        assert len(directives) == 1
-        assert isinstance(directives[0], FolderEndDirective)
-
-    def test_parse_nested_folders(self):
+    def test_parse_nested_folders(self, parser: CompassProjectParser):
         """Test parsing nested folders from documentation example."""
-        parser = CompassProjectParser()
         mak_content = """[Folder-1;
   #cave1.dat;
   [Folder-2;
@@ -560,9 +492,10 @@ class TestCompassProjectParser:
         directives = parser.parse_string(mak_content)
 
         # Count directive types
-        folder_starts = [d for d in directives if isinstance(d, FolderStartDirective)]
-        folder_ends = [d for d in directives if isinstance(d, FolderEndDirective)]
-        files = [d for d in directives if isinstance(d, FileDirective)]
+        by_type = _group_by_type(directives)
+        folder_starts = by_type[FolderStartDirective]
+        folder_ends = by_type[FolderEndDirective]
+        files = by_type[FileDirective]
 
         assert len(folder_starts) == 3  # Folder-1, Folder-2, Folder-3
         assert len(folder_ends) == 3  # Three closing ];
@@ -581,56 +514,48 @@ class TestCompassProjectParser:
         assert files[4].file == "cave5.dat"
         assert files[5].file == "cave6.dat"
 
-    def test_parse_comment(self):
+    def test_parse_comment(self, parser: CompassProjectParser):
         """Test parsing comment directive."""
-        parser = CompassProjectParser()
-        directives = parser.parse_string("/ This is a comment")
-
-        assert len(directives) == 1
-        assert isinstance(directives[0], CommentDirective)
-        assert directives[0].comment == "This is a comment"
+        directive = _parse_one(parser, "/ This is a comment", CommentDirective)
+        assert directive.comment == "This is a comment"
 
-    def test_parse_simple_file(self):
+    def test_parse_simple_file(self, parser: CompassProjectParser):
         """Test parsing simple file directive."""
-        parser = CompassProjectParser()
-        directives = parser.parse_string("#ENTRANCE.DAT;")
-
-        assert len(directives) == 1
-        assert isinstance(directives[0], FileDirective)
-        assert directives[0].file == "ENTRANCE.DAT"
-        assert directives[0].link_stations == []
+        directive = _parse_one(parser, "#ENTRANCE.DAT;", FileDirective)
+        assert directive.file == "ENTRANCE.DAT"
+        assert directive.link_stations == []
 
-    def test_parse_file(self, artifacts_dir: Path):
+    def test_parse_file(self, simple_mak_directives: list):
         """Test parsing a complete MAK file."""
-        parser = CompassProjectParser()
-        directives = parser.parse_file(artifacts_dir / "simple.mak")
+        directives = simple_mak_directives
 
         # Check directive types
-        assert any(isinstance(d, LocationDirective) for d in directives)
-        assert any(isinstance(d, DatumDirective) for d in directives)
-        assert any(isinstance(d, FlagsDirective) for d in directives)
-        assert any(isinstance(d, FileDirective) for d in directives)
+        by_type = _group_by_type(directives)
+        assert {
+            LocationDirective,
+            DatumDirective,
+            FlagsDirective,
+            FileDirective,
+        } <= by_type.keys()
 
         # Check location
-        locations = [d for d in directives if isinstance(d, LocationDirective)]
+        locations = by_type[LocationDirective]
         assert len(locations) == 1
         assert locations[0].utm_zone == 13
 
         # Check files
-        files = [d for d in directives if isinstance(d, FileDirective)]
+        files = by_type[FileDirective]
         assert len(files) == 1
         assert files[0].file == "simple.dat"
 
-    def test_parse_file_with_link_stations(self, artifacts_dir: Path):
+    def test_parse_file_with_link_stations(self, link_stations_mak_directives: list):
         """Test parsing file directive with link stations."""
-        parser = CompassProjectParser()
-        directives = parser.parse_file(artifacts_dir / "link_stations.mak")
+        directives = link_stations_mak_directives
 
         assert len(directives) >= 1
-        file_directive = next(
-            (d for d in directives if isinstance(d, FileDirective)), None
-        )
-        assert file_directive is not None
+        files = _group_by_type(directives).get(FileDirective)
+        assert files
+        file_directive = files[0]
         assert file_directive.file == "FULFORD.DAT"
         assert len(file_directive.link_stations) == 3
 
@@ -639,9 +564,9 @@ class TestCompassProjectParser:
         assert station_a.name == "A"
         assert station_a.location is not None
         assert station_a.location.unit == "f"
-        assert station_a.location.easting == pytest.approx(1.1)
-        assert station_a.location.northing == pytest.approx(2.2)
-        assert station_a.location.elevation == pytest.approx(3.3)
+        assert round(station_a.location.easting, 3) == 1.1
+        assert round(station_a.location.northing, 3) == 2.2
+        assert round(station_a.location.elevation, 3) == 3.3
 
         # Check second station (no location)
         station_b = file_directive.link_stations[1]
@@ -654,31 +579,22 @@ class TestCompassProjectParser:
         assert station_c.location is not None
         assert station_c.location.unit == "m"
 
-    def test_parse_invalid_utm_zone(self):
+    def test_parse_invalid_utm_zone(self, parser: CompassProjectParser):
         """Test that invalid UTM zone raises exception."""
-        parser = CompassProjectParser()
-
         with pytest.raises(CompassParseException, match="cannot be 0"):
             parser.parse_string("$0;")
 
         with pytest.raises(CompassParseException, match="UTM zone must be between"):
             parser.parse_string("$61;")
 
-    def test_parse_unknown_directive(self):
+    def test_parse_unknown_directive(self, parser: CompassProjectParser):
         """Test that unknown directives are parsed leniently."""
-        parser = CompassProjectParser()
-
         # Unknown directives are now parsed and preserved for roundtrip
+        directive = _parse_one(parser, "Xinvalid;", UnknownDirective)
+        assert directive.directive_type == "X"
+        assert directive.content == "invalid"
 
-        directives = parser.parse_string("Xinvalid;")
-        assert len(directives) == 1
-        assert isinstance(directives[0], UnknownDirective)
-        assert directives[0].directive_type == "X"
-        assert directives[0].content == "invalid"
-
-    def test_parse_missing_semicolon(self):
+    def test_parse_missing_semicolon(self, parser: CompassProjectParser):
         """Test that missing semicolon raises exception."""
-        parser = CompassProjectParser()
-
         with pytest.raises(CompassParseException):
             parser.parse_string("$13")
@@ -138,16 +138,10 @@ $-56;
 class TestSouthernHemisphereCoordinates:
     """Test coordinate conversions in southern hemisphere."""
 
-    def test_sydney_coordinates(self):
+    def test_sydney_coordinates(self, sydney_utm_coords):
         """Test real Sydney, Australia coordinates."""
         # Sydney Opera House approximate UTM coordinates (Zone 56S)
-        loc = UTMLocation(
-            easting=334000.0,
-            northing=6252000.0,
-            elevation=5.0,
-            zone=-56,
-            datum=Datum.WGS_1984,
-        )
+        loc = UTMLocation(**sydney_utm_coords, datum=Datum.WGS_1984)
 
         lat, lon = loc.to_latlon()
 
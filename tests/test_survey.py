@@ -7,6 +7,7 @@ from pathlib import Path
 import pytest
 
 from compass_lib.enums import Severity
+from compass_lib.survey.models import CompassDatFile
 from compass_lib.survey.models import CompassShot
 from compass_lib.survey.models import CompassSurvey
 from compass_lib.survey.models import CompassSurveyHeader
@@ -140,6 +141,28 @@ class TestCompassSurvey:
         assert len(survey.shots) == 1
 
 
+class TestCompassDatFile:
+    """Tests for CompassDatFile model."""
+
+    @pytest.mark.parametrize("n", [100, 10_000])
+    @pytest.mark.parametrize("closed", [False, True], ids=["open", "loop_closure"])
+    def test_get_all_stations_large(self, n, closed):
+        """Test station de-duplication on large open and loop-closed surveys."""
+        shots = [
+            CompassShot(from_station_name=f"A{i}", to_station_name=f"A{i + 1}")
+            for i in range(n)
+        ]
+        if closed:
+            # Revisits the first station right at the end
+            shots[-1] = shots[-1].model_copy(update={"to_station_name": "A0"})
+        survey = CompassSurvey(header=CompassSurveyHeader(), shots=shots)
+        dat = CompassDatFile(surveys=[survey])
+
+        stations = dat.get_all_stations()
+
+        assert len(stations) == (n if closed else n + 1)
+
+
 class TestCompassSurveyParser:
     """Tests for CompassSurveyParser."""
 